@@ -8,32 +8,39 @@ This agent processes service credit requests by:
 5. Recording a complete DecisionRecord
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Any
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
 import hashlib
-import json
-import uuid
+import itertools
 import sys
 import os
+import time
 
-# Add paths for imports
-ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, ROOT)
-sys.path.insert(0, os.path.join(ROOT, "sdk", "python"))
+import orjson
+
+# Running as a script (python demo/agent.py): make the repo root importable.
+# Package imports (import demo.agent) leave sys.path alone.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from demo.tools import SupportTools, CRMTools, IncidentTools, BillingTools, ApprovalTools
 from demo.policy import ServiceCreditPolicy, PolicyResult as DemoPolicyResult
 
 
 # Inline models to avoid import issues
 def generate_id() -> str:
-    return str(uuid.uuid4())
+    # Same layout as str(uuid.uuid4()) (version 4, RFC 4122 variant) without
+    # building a UUID object per ID.
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 
 def generate_hash(data: dict) -> str:
-    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()[:16]
 
 
 class ActorType(str, Enum):
@@ -56,7 +63,7 @@ class PolicyResult(str, Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class Actor:
     type: ActorType
     id: str
@@ -66,7 +73,7 @@ class Actor:
         return {"type": self.type.value, "id": self.id, "name": self.name}
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     source: str
     retrieved_at: datetime
@@ -92,7 +99,7 @@ class Evidence:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyEval:
     policy_id: str
     version: str
@@ -108,7 +115,7 @@ class PolicyEval:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Approval:
     approver: Actor
     granted: bool
@@ -126,7 +133,7 @@ class Approval:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     tool: str
     committed_at: datetime
@@ -146,7 +153,7 @@ class Action:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionRecord:
     run_id: str
     outcome: Outcome
@@ -175,17 +182,22 @@ class DecisionRecord:
             "metadata": self.metadata,
         }
 
+    def to_json(self, option: int = 0) -> bytes:
+        """Encode the record as JSON straight from the dataclass tree.
+
+        orjson walks dataclasses, datetimes and str enums natively, so this
+        produces the same document as ``to_dict()`` without building the
+        intermediate dicts.
+        """
+        return orjson.dumps(self, option=option, default=str)
+
 
 class ExceptionDeskAgent:
     """Agent that processes service credit exception requests."""
 
     def __init__(self):
-        self.support = SupportTools()
-        self.crm = CRMTools()
-        self.incidents = IncidentTools()
-        self.billing = BillingTools()
-        self.approvals = ApprovalTools()
         self.policy = ServiceCreditPolicy()
+        self._run_counter = itertools.count()
 
         # Accumulate for DecisionRecord
         self._evidence: list[Evidence] = []
@@ -193,9 +205,36 @@ class ExceptionDeskAgent:
         self._approvals: list[Approval] = []
         self._actions: list[Action] = []
 
+    # Tools are imported on first use so commands that never touch them
+    # (e.g. `cli.py explain`) don't load the mock integrations.
+    @cached_property
+    def support(self):
+        from demo.tools import SupportTools
+        return SupportTools()
+
+    @cached_property
+    def crm(self):
+        from demo.tools import CRMTools
+        return CRMTools()
+
+    @cached_property
+    def incidents(self):
+        from demo.tools import IncidentTools
+        return IncidentTools()
+
+    @cached_property
+    def billing(self):
+        from demo.tools import BillingTools
+        return BillingTools()
+
+    @cached_property
+    def approvals(self):
+        from demo.tools import ApprovalTools
+        return ApprovalTools()
+
     def process_ticket(self, ticket_id: str) -> dict:
         """Process a service credit request ticket end-to-end."""
-        run_id = f"run_{ticket_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        run_id = f"run_{ticket_id}_{int(time.time() * 1000)}_{next(self._run_counter)}"
         start_time = datetime.utcnow()
 
         print(f"\n{'='*60}")
@@ -215,26 +254,34 @@ class ExceptionDeskAgent:
             return self._finalize_decision(run_id, start_time, Outcome.DENIED, ticket_result.error)
 
         ticket = ticket_result.data
-        self._add_evidence("support.get_ticket", {"ticket_id": ticket_id}, ticket)
         print(f"    Ticket: {ticket['subject']}")
         print(f"    Requested: {ticket['requested_credit_pct']:.0%} credit")
 
         account_id = ticket["account_id"]
 
+        # Steps 2 and 3 only need account_id, so fetch them concurrently;
+        # leaving the block waits for both and releases the worker threads
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            account_future = pool.submit(self.crm.get_account, account_id)
+            incidents_future = pool.submit(self.incidents.get_recent, account_id, days=30)
+        # One stamp for the whole evidence phase, taken once every fetch is done
+        gathered_at = datetime.utcnow()
+        self._add_evidence("support.get_ticket", {"ticket_id": ticket_id}, ticket, gathered_at)
+
         # Step 2: Get account details
-        account_result = self.crm.get_account(account_id)
+        account_result = account_future.result()
         if not account_result.success:
             return self._finalize_decision(run_id, start_time, Outcome.DENIED, account_result.error)
 
         account = account_result.data
-        self._add_evidence("crm.get_account", {"account_id": account_id}, account)
+        self._add_evidence("crm.get_account", {"account_id": account_id}, account, gathered_at)
         print(f"    Account: {account['name']} ({account['tier']}, ARR ${account['arr']:,})")
         print(f"    Churn Risk: {account['churn_risk']}, Health: {account['health_score']}")
 
         # Step 3: Get incident history
-        incidents_result = self.incidents.get_recent(account_id, days=30)
+        incidents_result = incidents_future.result()
         incidents = incidents_result.data
-        self._add_evidence("incidents.get_recent", {"account_id": account_id, "days": 30}, incidents)
+        self._add_evidence("incidents.get_recent", {"account_id": account_id, "days": 30}, incidents, gathered_at)
         print(f"    Incidents (30d): {incidents['sev1_count']} SEV-1, {incidents['sev2_count']} SEV-2")
         print(f"    Total downtime: {incidents['total_downtime_mins']} minutes")
 
@@ -301,7 +348,7 @@ class ExceptionDeskAgent:
             "account_id": account_id,
             "amount": credit_amount,
             "credit_pct": ticket["requested_credit_pct"],
-        }, credit_result.data, success=True)
+        }, credit_result.data, success=True, committed_at=datetime.utcnow())
 
         print(f"    Credit ID: {credit_result.data['credit_id']}")
         print(f"    Amount: ${credit_amount:,.2f} ({ticket['requested_credit_pct']:.0%})")
@@ -319,10 +366,10 @@ class ExceptionDeskAgent:
             f"Credit issued via {policy_eval.exception_route or 'standard'} route"
         )
 
-    def _add_evidence(self, tool: str, args: dict, data: dict):
+    def _add_evidence(self, tool: str, args: dict, data: dict, retrieved_at: datetime):
         self._evidence.append(Evidence(
             source=tool,
-            retrieved_at=datetime.utcnow(),
+            retrieved_at=retrieved_at,
             tool_name=tool,
             tool_args=args,
             snapshot=data,
@@ -354,17 +401,21 @@ class ExceptionDeskAgent:
             reason=approval_data["reason"],
         ))
 
-    def _add_action(self, tool: str, params: dict, result: dict, success: bool):
+    def _add_action(self, tool: str, params: dict, result: dict, success: bool, committed_at: datetime):
         self._actions.append(Action(
             tool=tool,
-            committed_at=datetime.utcnow(),
+            committed_at=committed_at,
             params=params,
             result=result,
             success=success,
         ))
 
     def _finalize_decision(self, run_id: str, start_time: datetime, outcome: Outcome, reason: str) -> dict:
-        """Create the DecisionRecord."""
+        """Create the DecisionRecord.
+
+        The record is returned as the dataclass; callers convert it with
+        ``to_dict()`` or ``to_json()`` only when they need to render it.
+        """
         record = DecisionRecord(
             run_id=run_id,
             timestamp=start_time,
@@ -388,7 +439,7 @@ class ExceptionDeskAgent:
             "run_id": run_id,
             "outcome": outcome.value,
             "reason": reason,
-            "record": record.to_dict(),
+            "record": record,
         }
 
 
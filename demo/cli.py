@@ -2,132 +2,122 @@
 """Exception Desk CLI - Run the demo and explain decisions."""
 
 import argparse
-import json
+import io
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import orjson
+
+# Running as a script (python demo/cli.py): make the repo root importable.
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from demo.agent import ExceptionDeskAgent
 
 
+_RULE = "=" * 70
+_RESULT_SYMBOLS = {"pass": "✓", "warn": "⚠", "fail": "✗", "skip": "○"}
+
+
 def format_explain(record: dict) -> str:
     """Format a DecisionRecord as a readable explanation."""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    lines.append("")
-    lines.append("=" * 70)
-    lines.append("DECISION EXPLANATION")
-    lines.append("=" * 70)
-    lines.append("")
+    w(f"\n{_RULE}\nDECISION EXPLANATION\n{_RULE}\n\n")
 
     # Header
-    lines.append(f"Decision ID:  {record['decision_id']}")
-    lines.append(f"Run ID:       {record['run_id']}")
-    lines.append(f"Timestamp:    {record['timestamp']}")
-    lines.append(f"Outcome:      {record['outcome'].upper()}")
+    w(f"Decision ID:  {record['decision_id']}\n")
+    w(f"Run ID:       {record['run_id']}\n")
+    w(f"Timestamp:    {record['timestamp']}\n")
+    w(f"Outcome:      {record['outcome'].upper()}\n")
     if record.get('outcome_reason'):
-        lines.append(f"Reason:       {record['outcome_reason']}")
-    lines.append("")
+        w(f"Reason:       {record['outcome_reason']}\n")
+    w("\n")
 
     # Evidence Chain
     evidence = record.get('evidence', [])
-    lines.append(f"--- EVIDENCE CHAIN ({len(evidence)} items) ---")
-    lines.append("")
+    w(f"--- EVIDENCE CHAIN ({len(evidence)} items) ---\n\n")
     for i, e in enumerate(evidence, 1):
-        lines.append(f"  [{i}] {e['source']}")
-        lines.append(f"      Tool: {e.get('tool_name', 'N/A')}")
-        lines.append(f"      Retrieved: {e['retrieved_at']}")
-        if e.get('snapshot'):
-            snapshot = e['snapshot']
+        w(f"  [{i}] {e['source']}\n")
+        w(f"      Tool: {e.get('tool_name', 'N/A')}\n")
+        w(f"      Retrieved: {e['retrieved_at']}\n")
+        snapshot = e.get('snapshot')
+        if snapshot:
             # Show key fields based on source
             if 'requested_credit_pct' in snapshot:
-                lines.append(f"      -> Requested: {snapshot['requested_credit_pct']:.0%} credit")
-                lines.append(f"      -> Subject: {snapshot.get('subject', 'N/A')}")
+                w(f"      -> Requested: {snapshot['requested_credit_pct']:.0%} credit\n")
+                w(f"      -> Subject: {snapshot.get('subject', 'N/A')}\n")
             elif 'arr' in snapshot:
-                lines.append(f"      -> Account: {snapshot.get('name')} ({snapshot.get('tier')})")
-                lines.append(f"      -> ARR: ${snapshot['arr']:,}, Churn Risk: {snapshot.get('churn_risk')}")
+                w(f"      -> Account: {snapshot.get('name')} ({snapshot.get('tier')})\n")
+                w(f"      -> ARR: ${snapshot['arr']:,}, Churn Risk: {snapshot.get('churn_risk')}\n")
             elif 'sev1_count' in snapshot:
-                lines.append(f"      -> SEV-1: {snapshot['sev1_count']}, SEV-2: {snapshot['sev2_count']}")
-                lines.append(f"      -> Total downtime: {snapshot['total_downtime_mins']} mins")
-        lines.append("")
+                w(f"      -> SEV-1: {snapshot['sev1_count']}, SEV-2: {snapshot['sev2_count']}\n")
+                w(f"      -> Total downtime: {snapshot['total_downtime_mins']} mins\n")
+        w("\n")
 
     # Policy Chain
     policies = record.get('policies', [])
-    lines.append(f"--- POLICY CHAIN ({len(policies)} evaluations) ---")
-    lines.append("")
+    w(f"--- POLICY CHAIN ({len(policies)} evaluations) ---\n\n")
+    symbol_for = _RESULT_SYMBOLS.get
     for i, p in enumerate(policies, 1):
-        result_symbol = {"pass": "✓", "warn": "⚠", "fail": "✗"}.get(p['result'], "?")
-        lines.append(f"  [{i}] {result_symbol} {p['policy_id']} v{p['version']}")
-        lines.append(f"      Result: {p['result'].upper()}")
+        result_symbol = symbol_for(p['result'], "?")
+        w(f"  [{i}] {result_symbol} {p['policy_id']} v{p['version']}\n")
+        w(f"      Result: {p['result'].upper()}\n")
         if p.get('message'):
-            lines.append(f"      Details: {p['message']}")
-        lines.append("")
+            w(f"      Details: {p['message']}\n")
+        w("\n")
 
     # Approval Chain
     approvals = record.get('approvals', [])
-    lines.append(f"--- APPROVAL CHAIN ({len(approvals)} approvals) ---")
-    lines.append("")
+    w(f"--- APPROVAL CHAIN ({len(approvals)} approvals) ---\n\n")
     if not approvals:
-        lines.append("  (No approvals required)")
-        lines.append("")
+        w("  (No approvals required)\n\n")
     for i, a in enumerate(approvals, 1):
-        status = "APPROVED" if a['granted'] else "DENIED"
-        symbol = "✓" if a['granted'] else "✗"
+        status, symbol = ("APPROVED", "✓") if a['granted'] else ("DENIED", "✗")
         approver = a.get('approver', {})
-        lines.append(f"  [{i}] {symbol} {status}")
-        lines.append(f"      Approver: {approver.get('id', 'Unknown')} ({approver.get('name', '')})")
-        lines.append(f"      Decided: {a['granted_at']}")
+        w(f"  [{i}] {symbol} {status}\n")
+        w(f"      Approver: {approver.get('id', 'Unknown')} ({approver.get('name', '')})\n")
+        w(f"      Decided: {a['granted_at']}\n")
         if a.get('reason'):
-            lines.append(f"      Reason: {a['reason']}")
-        lines.append("")
+            w(f"      Reason: {a['reason']}\n")
+        w("\n")
 
     # Action Chain
     actions = record.get('actions', [])
-    lines.append(f"--- ACTION CHAIN ({len(actions)} commits) ---")
-    lines.append("")
+    w(f"--- ACTION CHAIN ({len(actions)} commits) ---\n\n")
     if not actions:
-        lines.append("  (No actions committed)")
-        lines.append("")
+        w("  (No actions committed)\n\n")
     for i, a in enumerate(actions, 1):
-        status = "SUCCESS" if a['success'] else "FAILED"
-        symbol = "✓" if a['success'] else "✗"
-        lines.append(f"  [{i}] {symbol} {a['tool']}")
-        lines.append(f"      Status: {status}")
-        lines.append(f"      Committed: {a['committed_at']}")
-        if a.get('params'):
-            params = a['params']
-            if 'amount' in params:
-                lines.append(f"      Amount: ${params['amount']:,.2f} ({params.get('credit_pct', 0):.0%})")
-        if a.get('result'):
-            result = a['result']
-            if 'credit_id' in result:
-                lines.append(f"      Credit ID: {result['credit_id']}")
-        lines.append("")
+        status, symbol = ("SUCCESS", "✓") if a['success'] else ("FAILED", "✗")
+        w(f"  [{i}] {symbol} {a['tool']}\n")
+        w(f"      Status: {status}\n")
+        w(f"      Committed: {a['committed_at']}\n")
+        params = a.get('params')
+        if params and 'amount' in params:
+            w(f"      Amount: ${params['amount']:,.2f} ({params.get('credit_pct', 0):.0%})\n")
+        result = a.get('result')
+        if result and 'credit_id' in result:
+            w(f"      Credit ID: {result['credit_id']}\n")
+        w("\n")
 
     # Summary
-    lines.append("--- SUMMARY ---")
-    lines.append("")
-    summary_parts = []
+    w("--- SUMMARY ---\n\n")
     if evidence:
-        summary_parts.append(f"Gathered {len(evidence)} pieces of evidence")
+        w(f"  • Gathered {len(evidence)} pieces of evidence\n")
     if policies:
         passed = sum(1 for p in policies if p['result'] == 'pass')
-        summary_parts.append(f"Evaluated {len(policies)} policies ({passed} passed)")
+        w(f"  • Evaluated {len(policies)} policies ({passed} passed)\n")
     if approvals:
         approved = sum(1 for a in approvals if a['granted'])
-        summary_parts.append(f"Received {approved}/{len(approvals)} approvals")
+        w(f"  • Received {approved}/{len(approvals)} approvals\n")
     if actions:
         succeeded = sum(1 for a in actions if a['success'])
-        summary_parts.append(f"Executed {succeeded}/{len(actions)} actions")
-    summary_parts.append(f"Final outcome: {record['outcome'].upper()}")
+        w(f"  • Executed {succeeded}/{len(actions)} actions\n")
+    w(f"  • Final outcome: {record['outcome'].upper()}\n")
+    w(f"\n{_RULE}")
 
-    for part in summary_parts:
-        lines.append(f"  • {part}")
-    lines.append("")
-    lines.append("=" * 70)
-
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def cmd_run(args):
@@ -137,12 +127,14 @@ def cmd_run(args):
     agent = ExceptionDeskAgent()
     result = agent.process_ticket(args.ticket)
 
+    record = result['record']
+
     if args.explain:
-        print(format_explain(result['record']))
+        print(format_explain(record.to_dict()))
 
     if args.json:
         print("\n--- RAW JSON ---")
-        print(json.dumps(result['record'], indent=2, default=str))
+        print(record.to_json(option=orjson.OPT_INDENT_2).decode())
 
     return result
 
@@ -150,10 +142,10 @@ def cmd_run(args):
 def cmd_explain(args):
     """Explain a decision from JSON file or stdin."""
     if args.file:
-        with open(args.file) as f:
-            record = json.load(f)
+        with open(args.file, "rb") as f:
+            record = orjson.loads(f.read())
     else:
-        record = json.load(sys.stdin)
+        record = orjson.loads(sys.stdin.buffer.read())
 
     if 'record' in record:
         record = record['record']
@@ -9,6 +9,7 @@ Policy: service_credit v1.0
 """
 
 from dataclasses import dataclass
+import functools
 from typing import Optional
 from enum import Enum
 
@@ -42,6 +43,10 @@ class ServiceCreditPolicy:
     MAX_EXCEPTION_PCT = 0.25  # 25%
     SEV1_THRESHOLD = 2
 
+    # Pre-formatted limits used in every denial message
+    DEFAULT_CAP_LABEL = f"{DEFAULT_CAP_PCT:.0%}"
+    MAX_EXCEPTION_LABEL = f"{MAX_EXCEPTION_PCT:.0%}"
+
     def evaluate(
         self,
         requested_pct: float,
@@ -60,34 +65,44 @@ class ServiceCreditPolicy:
             "account_tier": account_tier,
         }
 
+        result, exception_route, requires_approval, approval_reason = self._decide(
+            requested_pct, sev1_count, churn_risk
+        )
+        return PolicyEvaluation(
+            policy_id=self.POLICY_ID,
+            version=self.VERSION,
+            result=result,
+            requested_pct=requested_pct,
+            cap_pct=self.DEFAULT_CAP_PCT,
+            max_exception_pct=self.MAX_EXCEPTION_PCT,
+            exception_route=exception_route,
+            requires_approval=requires_approval,
+            approval_reason=approval_reason,
+            details=details,
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _decide(
+        cls,
+        requested_pct: float,
+        sev1_count: int,
+        churn_risk: str,
+    ) -> tuple[PolicyResult, Optional[str], bool, Optional[str]]:
+        """Pure decision logic: (result, exception_route, requires_approval, approval_reason).
+
+        Memoized because batch runs repeat the same few input combinations;
+        sev2_count and account_tier do not affect the outcome.
+        """
         # Check if within default cap
-        if requested_pct <= self.DEFAULT_CAP_PCT:
-            return PolicyEvaluation(
-                policy_id=self.POLICY_ID,
-                version=self.VERSION,
-                result=PolicyResult.APPROVED,
-                requested_pct=requested_pct,
-                cap_pct=self.DEFAULT_CAP_PCT,
-                max_exception_pct=self.MAX_EXCEPTION_PCT,
-                exception_route=None,
-                requires_approval=False,
-                approval_reason=None,
-                details=details,
-            )
+        if requested_pct <= cls.DEFAULT_CAP_PCT:
+            return PolicyResult.APPROVED, None, False, None
 
         # Check if exceeds maximum exception
-        if requested_pct > self.MAX_EXCEPTION_PCT:
-            return PolicyEvaluation(
-                policy_id=self.POLICY_ID,
-                version=self.VERSION,
-                result=PolicyResult.DENIED,
-                requested_pct=requested_pct,
-                cap_pct=self.DEFAULT_CAP_PCT,
-                max_exception_pct=self.MAX_EXCEPTION_PCT,
-                exception_route=None,
-                requires_approval=False,
-                approval_reason=f"Requested {requested_pct:.0%} exceeds maximum allowed {self.MAX_EXCEPTION_PCT:.0%}",
-                details=details,
+        if requested_pct > cls.MAX_EXCEPTION_PCT:
+            return (
+                PolicyResult.DENIED, None, False,
+                f"Requested {requested_pct:.0%} exceeds maximum allowed {cls.MAX_EXCEPTION_LABEL}",
             )
 
         # Check exception eligibility
@@ -95,7 +110,7 @@ class ServiceCreditPolicy:
         exception_route = None
         exception_reasons = []
 
-        if sev1_count >= self.SEV1_THRESHOLD:
+        if sev1_count >= cls.SEV1_THRESHOLD:
             exception_eligible = True
             exception_route = "service_impact_exception"
             exception_reasons.append(f"{sev1_count} SEV-1 incidents in last 30 days")
@@ -106,30 +121,11 @@ class ServiceCreditPolicy:
             exception_reasons.append("High churn risk")
 
         if not exception_eligible:
-            return PolicyEvaluation(
-                policy_id=self.POLICY_ID,
-                version=self.VERSION,
-                result=PolicyResult.DENIED,
-                requested_pct=requested_pct,
-                cap_pct=self.DEFAULT_CAP_PCT,
-                max_exception_pct=self.MAX_EXCEPTION_PCT,
-                exception_route=None,
-                requires_approval=False,
-                approval_reason=f"Requested {requested_pct:.0%} exceeds cap ({self.DEFAULT_CAP_PCT:.0%}) "
-                               f"and no exception criteria met",
-                details=details,
+            return (
+                PolicyResult.DENIED, None, False,
+                f"Requested {requested_pct:.0%} exceeds cap ({cls.DEFAULT_CAP_LABEL}) "
+                f"and no exception criteria met",
             )
 
         # Exception route available, requires approval
-        return PolicyEvaluation(
-            policy_id=self.POLICY_ID,
-            version=self.VERSION,
-            result=PolicyResult.EXCEPTION_REQUIRED,
-            requested_pct=requested_pct,
-            cap_pct=self.DEFAULT_CAP_PCT,
-            max_exception_pct=self.MAX_EXCEPTION_PCT,
-            exception_route=exception_route,
-            requires_approval=True,
-            approval_reason="; ".join(exception_reasons),
-            details=details,
-        )
+        return PolicyResult.EXCEPTION_REQUIRED, exception_route, True, "; ".join(exception_reasons)
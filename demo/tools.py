@@ -8,14 +8,46 @@ These tools simulate:
 - Slack (approvals)
 """
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
-import random
+import contextlib
+import itertools
+import logging
+import os
+import threading
 import time
 
 
-# Mock data stores
+logger = logging.getLogger(__name__)
+
+
+def _fake_latency_scale() -> float:
+    """Scale factor for the simulated API latency; CONTEXTGRAPH_FAKE_LATENCY=0 disables it."""
+    raw = os.environ.get("CONTEXTGRAPH_FAKE_LATENCY", "1")
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid CONTEXTGRAPH_FAKE_LATENCY=%r, using 1", raw)
+        return 1.0
+
+
+_FAKE_LATENCY = _fake_latency_scale()
+
+
+def _simulate_latency(seconds: float):
+    if _FAKE_LATENCY:
+        time.sleep(seconds * _FAKE_LATENCY)
+
+
+# Mock-store writes are only locked when tools run from several threads
+_LOCK = threading.Lock() if os.environ.get("CONTEXTGRAPH_THREADSAFE") == "1" else contextlib.nullcontext()
+
+
+# Mock data stores, dated relative to a single import-time clock reading
+_NOW = datetime.now()
+
 TICKETS = {
     "SUP-4312": {
         "id": "SUP-4312",
@@ -26,7 +58,7 @@ TICKETS = {
         "requested_credit_pct": 0.20,
         "status": "open",
         "priority": "high",
-        "created_at": (datetime.now() - timedelta(hours=2)).isoformat(),
+        "created_at": (_NOW - timedelta(hours=2)).isoformat(),
         "requester": "ops-lead@acme.com",
     },
     "SUP-4400": {
@@ -37,7 +69,7 @@ TICKETS = {
         "requested_credit_pct": 0.08,
         "status": "open",
         "priority": "medium",
-        "created_at": (datetime.now() - timedelta(hours=5)).isoformat(),
+        "created_at": (_NOW - timedelta(hours=5)).isoformat(),
         "requester": "billing@startup.io",
     },
 }
@@ -52,7 +84,7 @@ ACCOUNTS = {
         "churn_risk": "high",
         "health_score": 45,
         "csm": "sarah@ourcompany.com",
-        "renewal_date": (datetime.now() + timedelta(days=60)).isoformat(),
+        "renewal_date": (_NOW + timedelta(days=60)).isoformat(),
     },
     "ACC-STARTUP-002": {
         "id": "ACC-STARTUP-002",
@@ -63,28 +95,63 @@ ACCOUNTS = {
         "churn_risk": "low",
         "health_score": 82,
         "csm": "mike@ourcompany.com",
-        "renewal_date": (datetime.now() + timedelta(days=180)).isoformat(),
+        "renewal_date": (_NOW + timedelta(days=180)).isoformat(),
     },
 }
 
-INCIDENTS = {
+
+@dataclass(slots=True, frozen=True)
+class Incident:
+    """A PagerDuty-like incident; the parsed date is kept for get_recent's filter.
+
+    Records are immutable, so INCIDENTS is updated by appending or replacing
+    entries, and get_recent always sees the current store.
+    """
+    id: str
+    severity: str
+    title: str
+    duration_mins: int
+    date: str  # ISO 8601, as the API returns it
+    timestamp: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "timestamp", datetime.fromisoformat(self.date).timestamp())
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "severity": self.severity,
+            "title": self.title,
+            "duration_mins": self.duration_mins,
+            "date": self.date,
+        }
+
+
+INCIDENTS: dict[str, list[Incident]] = {
     "ACC-ACME-001": [
-        {"id": "INC-901", "severity": "SEV-1", "title": "API Gateway Complete Outage", "duration_mins": 45, "date": (datetime.now() - timedelta(days=5)).isoformat()},
-        {"id": "INC-887", "severity": "SEV-1", "title": "Database Failover Failure", "duration_mins": 90, "date": (datetime.now() - timedelta(days=12)).isoformat()},
-        {"id": "INC-892", "severity": "SEV-1", "title": "Authentication Service Down", "duration_mins": 30, "date": (datetime.now() - timedelta(days=18)).isoformat()},
-        {"id": "INC-856", "severity": "SEV-2", "title": "Elevated Latency", "duration_mins": 120, "date": (datetime.now() - timedelta(days=8)).isoformat()},
-        {"id": "INC-861", "severity": "SEV-2", "title": "Partial Feature Degradation", "duration_mins": 60, "date": (datetime.now() - timedelta(days=22)).isoformat()},
+        Incident(id="INC-901", severity="SEV-1", title="API Gateway Complete Outage", duration_mins=45, date=(_NOW - timedelta(days=5)).isoformat()),
+        Incident(id="INC-887", severity="SEV-1", title="Database Failover Failure", duration_mins=90, date=(_NOW - timedelta(days=12)).isoformat()),
+        Incident(id="INC-892", severity="SEV-1", title="Authentication Service Down", duration_mins=30, date=(_NOW - timedelta(days=18)).isoformat()),
+        Incident(id="INC-856", severity="SEV-2", title="Elevated Latency", duration_mins=120, date=(_NOW - timedelta(days=8)).isoformat()),
+        Incident(id="INC-861", severity="SEV-2", title="Partial Feature Degradation", duration_mins=60, date=(_NOW - timedelta(days=22)).isoformat()),
     ],
     "ACC-STARTUP-002": [
-        {"id": "INC-899", "severity": "SEV-2", "title": "Slow Dashboard Loading", "duration_mins": 30, "date": (datetime.now() - timedelta(days=10)).isoformat()},
+        Incident(id="INC-899", severity="SEV-2", title="Slow Dashboard Loading", duration_mins=30, date=(_NOW - timedelta(days=10)).isoformat()),
     ],
 }
 
-CREDITS_ISSUED: list[dict] = []
-APPROVAL_QUEUE: list[dict] = []
 
+# Sequential IDs for records created by the tools
+_NOTE_SEQ = itertools.count(1000)
+_CREDIT_SEQ = itertools.count(10000)
+_APPROVAL_SEQ = itertools.count(1000)
+
+CREDITS_ISSUED: deque[dict] = deque()
+CREDITS_BY_ACCOUNT: dict[str, list[dict]] = {}
+APPROVAL_QUEUE: deque[dict] = deque()
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolResult:
     success: bool
     data: dict
@@ -97,7 +164,7 @@ class SupportTools:
     @staticmethod
     def get_ticket(ticket_id: str) -> ToolResult:
         """Retrieve support ticket details."""
-        time.sleep(0.1)  # Simulate API latency
+        _simulate_latency(0.1)  # Simulate API latency
         ticket = TICKETS.get(ticket_id)
         if not ticket:
             return ToolResult(success=False, data={}, error=f"Ticket {ticket_id} not found")
@@ -106,10 +173,10 @@ class SupportTools:
     @staticmethod
     def post_internal_note(ticket_id: str, note: str) -> ToolResult:
         """Post an internal note to the ticket."""
-        time.sleep(0.1)
+        _simulate_latency(0.1)
         if ticket_id not in TICKETS:
             return ToolResult(success=False, data={}, error=f"Ticket {ticket_id} not found")
-        note_id = f"NOTE-{random.randint(1000, 9999)}"
+        note_id = f"NOTE-{next(_NOTE_SEQ)}"
         return ToolResult(
             success=True,
             data={"note_id": note_id, "ticket_id": ticket_id, "posted_at": datetime.now().isoformat()}
@@ -118,10 +185,11 @@ class SupportTools:
     @staticmethod
     def update_ticket_status(ticket_id: str, status: str, resolution: str) -> ToolResult:
         """Update ticket status and resolution."""
-        time.sleep(0.1)
+        _simulate_latency(0.1)
         if ticket_id not in TICKETS:
             return ToolResult(success=False, data={}, error=f"Ticket {ticket_id} not found")
-        TICKETS[ticket_id]["status"] = status
+        with _LOCK:
+            TICKETS[ticket_id]["status"] = status
         return ToolResult(
             success=True,
             data={"ticket_id": ticket_id, "status": status, "resolution": resolution}
@@ -134,7 +202,7 @@ class CRMTools:
     @staticmethod
     def get_account(account_id: str) -> ToolResult:
         """Retrieve account details including tier, ARR, and churn risk."""
-        time.sleep(0.1)
+        _simulate_latency(0.1)
         account = ACCOUNTS.get(account_id)
         if not account:
             return ToolResult(success=False, data={}, error=f"Account {account_id} not found")
@@ -147,14 +215,21 @@ class IncidentTools:
     @staticmethod
     def get_recent(account_id: str, days: int = 30) -> ToolResult:
         """Get recent incidents for an account."""
-        time.sleep(0.1)
-        incidents = INCIDENTS.get(account_id, [])
-        cutoff = datetime.now() - timedelta(days=days)
-
-        recent = [inc for inc in incidents if datetime.fromisoformat(inc["date"]) > cutoff]
-        sev1_count = sum(1 for inc in recent if inc["severity"] == "SEV-1")
-        sev2_count = sum(1 for inc in recent if inc["severity"] == "SEV-2")
-        total_downtime = sum(inc["duration_mins"] for inc in recent)
+        _simulate_latency(0.1)
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+
+        recent = []
+        sev1_count = sev2_count = total_downtime = 0
+        for inc in INCIDENTS.get(account_id, ()):
+            if inc.timestamp <= cutoff:
+                continue
+            recent.append(inc.to_dict())
+            severity = inc.severity
+            if severity == "SEV-1":
+                sev1_count += 1
+            elif severity == "SEV-2":
+                sev2_count += 1
+            total_downtime += inc.duration_mins
 
         return ToolResult(
             success=True,
@@ -175,31 +250,34 @@ class BillingTools:
     @staticmethod
     def create_service_credit(account_id: str, amount: float, credit_pct: float, memo: str) -> ToolResult:
         """Issue a service credit to an account. THIS IS THE COMMIT ACTION."""
-        time.sleep(0.2)  # Slightly longer for "important" action
+        _simulate_latency(0.2)  # Slightly longer for "important" action
 
         account = ACCOUNTS.get(account_id)
         if not account:
             return ToolResult(success=False, data={}, error=f"Account {account_id} not found")
 
-        credit_id = f"CREDIT-{random.randint(10000, 99999)}"
+        credit_id = f"CREDIT-{next(_CREDIT_SEQ)}"
+        now = datetime.now()
         credit = {
             "credit_id": credit_id,
             "account_id": account_id,
             "amount": amount,
             "credit_pct": credit_pct,
             "memo": memo,
-            "issued_at": datetime.now().isoformat(),
-            "applies_to_invoice": f"INV-{datetime.now().strftime('%Y%m')}",
+            "issued_at": now.isoformat(),
+            "applies_to_invoice": f"INV-{now:%Y%m}",
         }
-        CREDITS_ISSUED.append(credit)
+        with _LOCK:
+            CREDITS_ISSUED.append(credit)
+            CREDITS_BY_ACCOUNT.setdefault(account_id, []).append(credit)
 
         return ToolResult(success=True, data=credit)
 
     @staticmethod
     def get_credits(account_id: str) -> ToolResult:
         """Get all credits for an account."""
-        credits = [c for c in CREDITS_ISSUED if c["account_id"] == account_id]
-        return ToolResult(success=True, data={"credits": credits})
+        credits = CREDITS_BY_ACCOUNT.get(account_id, [])
+        return ToolResult(success=True, data={"credits": list(credits)})
 
 
 class ApprovalTools:
@@ -215,16 +293,17 @@ class ApprovalTools:
         exception_reason: str,
     ) -> ToolResult:
         """Request approval from Finance for an exception. Simulates Slack approval flow."""
-        time.sleep(0.3)  # Simulate human thinking time
+        _simulate_latency(0.3)  # Simulate human thinking time
 
         # Auto-approve for demo (in reality this would block until human responds)
         # Approval logic: approve if exception_reason is compelling
-        approved = "SEV-1" in exception_reason or "churn" in exception_reason.lower()
+        reason = exception_reason.casefold()
+        approved = "sev-1" in reason or "churn" in reason
 
         approver = "finance-lead@ourcompany.com" if approved else "finance-review@ourcompany.com"
 
         result = {
-            "request_id": f"APR-{random.randint(1000, 9999)}",
+            "request_id": f"APR-{next(_APPROVAL_SEQ)}",
             "ticket_id": ticket_id,
             "account_id": account_id,
             "credit_pct": credit_pct,
@@ -235,6 +314,7 @@ class ApprovalTools:
             "decided_at": datetime.now().isoformat(),
             "reason": "Exception justified by service impact" if approved else "Insufficient justification",
         }
-        APPROVAL_QUEUE.append(result)
+        with _LOCK:
+            APPROVAL_QUEUE.append(result)
 
         return ToolResult(success=True, data=result)
@@ -16,136 +16,172 @@ Run:
     # python examples/demo.py
 """
 
+import http.client
 import json
 from datetime import datetime
-import urllib.request
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
 
 SERVER_URL = "http://localhost:8080"
 
 
-def create_sample_decision():
-    """Create a sample decision record simulating an agent discount approval flow."""
-    decision = {
-        "decision_id": f"dec_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-        "run_id": "run_discount_review_001",
-        "trace_id": "otel-trace-abc123",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "actor": {
-            "type": "agent",
-            "id": "discount-review-agent",
-            "name": "Discount Review Agent"
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Static shape of the sample decision; IDs and timestamps are filled per call
+_DECISION_TEMPLATE = {
+    "decision_id": None,
+    "run_id": "run_discount_review_001",
+    "trace_id": "otel-trace-abc123",
+    "timestamp": None,
+    "actor": {
+        "type": "agent",
+        "id": "discount-review-agent",
+        "name": "Discount Review Agent"
+    },
+    "subject_entities": [
+        {
+            "namespace": "crm",
+            "type": "Opportunity",
+            "id": "OPP-2024-001",
+            "aliases": ["salesforce:006xx00000ABC"]
+        }
+    ],
+    "evidence": [
+        {
+            "evidence_id": "ev_001",
+            "source": "crm",
+            "entity_ref": {
+                "namespace": "crm",
+                "type": "Account",
+                "id": "ACC-100",
+                "aliases": []
+            },
+            "snapshot": {
+                "arr": 500000,
+                "tier": "enterprise",
+                "health_score": 85
+            },
+            "retrieved_at": None,
+            "tool_name": "get_account",
+            "tool_args": {"account_id": "ACC-100"}
         },
-        "subject_entities": [
-            {
+        {
+            "evidence_id": "ev_002",
+            "source": "pagerduty",
+            "snapshot": {
+                "incidents_last_90d": 3,
+                "sev1_count": 1,
+                "mttr_hours": 2.5
+            },
+            "retrieved_at": None,
+            "tool_name": "get_incidents",
+            "tool_args": {"account_id": "ACC-100", "days": 90}
+        }
+    ],
+    "policies": [
+        {
+            "policy_id": "discount_cap",
+            "version": "3.2",
+            "result": "fail",
+            "message": "Requested 20% exceeds standard cap of 15%"
+        },
+        {
+            "policy_id": "service_impact_exception",
+            "version": "1.0",
+            "result": "pass",
+            "message": "SEV-1 incident qualifies for exception route"
+        }
+    ],
+    "approvals": [
+        {
+            "approval_id": "apr_001",
+            "approver": {
+                "type": "human",
+                "id": "finance-lead@company.com",
+                "name": "Finance Lead"
+            },
+            "granted": True,
+            "granted_at": None,
+            "reason": "Approved due to service impact and retention risk"
+        }
+    ],
+    "actions": [
+        {
+            "action_id": "act_001",
+            "tool": "update_opportunity",
+            "operation": "set_discount",
+            "target_entity": {
                 "namespace": "crm",
                 "type": "Opportunity",
                 "id": "OPP-2024-001",
-                "aliases": ["salesforce:006xx00000ABC"]
-            }
-        ],
-        "evidence": [
-            {
-                "evidence_id": "ev_001",
-                "source": "crm",
-                "entity_ref": {
-                    "namespace": "crm",
-                    "type": "Account",
-                    "id": "ACC-100",
-                    "aliases": []
-                },
-                "snapshot": {
-                    "arr": 500000,
-                    "tier": "enterprise",
-                    "health_score": 85
-                },
-                "retrieved_at": datetime.utcnow().isoformat() + "Z",
-                "tool_name": "get_account",
-                "tool_args": {"account_id": "ACC-100"}
-            },
-            {
-                "evidence_id": "ev_002",
-                "source": "pagerduty",
-                "snapshot": {
-                    "incidents_last_90d": 3,
-                    "sev1_count": 1,
-                    "mttr_hours": 2.5
-                },
-                "retrieved_at": datetime.utcnow().isoformat() + "Z",
-                "tool_name": "get_incidents",
-                "tool_args": {"account_id": "ACC-100", "days": 90}
-            }
-        ],
-        "policies": [
-            {
-                "policy_id": "discount_cap",
-                "version": "3.2",
-                "result": "fail",
-                "message": "Requested 20% exceeds standard cap of 15%"
+                "aliases": []
             },
-            {
-                "policy_id": "service_impact_exception",
-                "version": "1.0",
-                "result": "pass",
-                "message": "SEV-1 incident qualifies for exception route"
-            }
-        ],
-        "approvals": [
-            {
-                "approval_id": "apr_001",
-                "approver": {
-                    "type": "human",
-                    "id": "finance-lead@company.com",
-                    "name": "Finance Lead"
-                },
-                "granted": True,
-                "granted_at": datetime.utcnow().isoformat() + "Z",
-                "reason": "Approved due to service impact and retention risk"
-            }
-        ],
-        "actions": [
-            {
-                "action_id": "act_001",
-                "tool": "update_opportunity",
-                "operation": "set_discount",
-                "target_entity": {
-                    "namespace": "crm",
-                    "type": "Opportunity",
-                    "id": "OPP-2024-001",
-                    "aliases": []
-                },
-                "params": {"discount_percent": 20},
-                "result": {"status": "updated", "new_value": 20},
-                "committed_at": datetime.utcnow().isoformat() + "Z",
-                "success": True
-            }
-        ],
-        "outcome": "committed",
-        "outcome_reason": "Exception approved via service_impact route",
-        "precedent_refs": [],
-        "metadata": {
-            "framework": "demo",
-            "version": "0.1.0"
+            "params": {"discount_percent": 20},
+            "result": {"status": "updated", "new_value": 20},
+            "committed_at": None,
+            "success": True
         }
+    ],
+    "outcome": "committed",
+    "outcome_reason": "Exception approved via service_impact route",
+    "precedent_refs": [],
+    "metadata": {
+        "framework": "demo",
+        "version": "0.1.0"
     }
+}
+
+
+def create_sample_decision():
+    """Create a sample decision record simulating an agent discount approval flow."""
+    # JSON round-trip is a cheap deep copy for JSON-shaped data
+    decision = _loads(_dumps(_DECISION_TEMPLATE))
+    timestamp = datetime.utcnow().isoformat() + "Z"
+
+    decision["decision_id"] = f"dec_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    decision["timestamp"] = timestamp
+    for evidence in decision["evidence"]:
+        evidence["retrieved_at"] = timestamp
+    for approval in decision["approvals"]:
+        approval["granted_at"] = timestamp
+    for action in decision["actions"]:
+        action["committed_at"] = timestamp
     return decision
 
 
-def post_decision(decision: dict) -> dict:
+def _request(conn: http.client.HTTPConnection, method: str, path: str, body: bytes = None) -> dict:
+    """Send one request on a keep-alive connection and decode the JSON reply."""
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    conn.request(method, path, body=body, headers=headers)
+    resp = conn.getresponse()
+    data = resp.read()  # drain fully so the connection can be reused
+    if resp.status >= 400:
+        raise RuntimeError(f"HTTP {resp.status}: {data.decode(errors='replace')}")
+    return _loads(data)
+
+
+def post_decision(conn: http.client.HTTPConnection, decision: dict) -> dict:
     """Post a decision to the server."""
-    req = urllib.request.Request(
-        f"{SERVER_URL}/v1/decisions",
-        data=json.dumps(decision).encode(),
-        headers={"Content-Type": "application/json"},
-        method="POST"
-    )
-    with urllib.request.urlopen(req) as resp:
-        return json.loads(resp.read())
+    return _request(conn, "POST", "/v1/decisions", _dumps(decision))
 
 
-def get_explain(decision_id: str) -> dict:
+def get_explain(conn: http.client.HTTPConnection, decision_id: str) -> dict:
     """Get explanation for a decision."""
-    with urllib.request.urlopen(f"{SERVER_URL}/v1/decisions/{decision_id}/explain") as resp:
-        return json.loads(resp.read())
+    return _request(conn, "GET", f"/v1/decisions/{decision_id}/explain")
 
 
 def main():
@@ -159,19 +195,23 @@ def main():
     print(f"   Run ID: {decision['run_id']}")
     print(f"   Actor: {decision['actor']['name']}")
 
+    # Both requests share one keep-alive connection
+    conn = http.client.HTTPConnection(urlsplit(SERVER_URL).netloc, timeout=30)
+
     try:
-        result = post_decision(decision)
+        result = post_decision(conn, decision)
         print(f"   -> Submitted: {result}")
     except Exception as e:
         print(f"   -> Error (is server running?): {e}")
         print("\n   To run server:")
         print("   DATABASE_URL=postgresql://localhost/contextgraph uvicorn server.main:app --port 8080")
+        conn.close()
         return
 
     # Get explanation
     print(f"\n2. Querying explanation...")
     try:
-        explain = get_explain(decision["decision_id"])
+        explain = get_explain(conn, decision["decision_id"])
 
         print(f"\n{'=' * 60}")
         print("DECISION EXPLANATION")
@@ -200,6 +240,8 @@ def main():
 
     except Exception as e:
         print(f"   -> Error: {e}")
+    finally:
+        conn.close()
 
     print("\n" + "=" * 60)
     print("Demo complete!")
@@ -42,7 +42,7 @@ class MockSpanType(str, Enum):
     HANDOFF = "handoff"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockSpan:
     span_id: str
     trace_id: str
@@ -55,7 +55,7 @@ class MockSpan:
     status: str = "ok"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockTrace:
     trace_id: str
     name: str
@@ -77,13 +77,13 @@ class MockTraceManager:
         self._processor = processor
 
     def start_trace(self, name: str, metadata: dict = None) -> MockTrace:
-        trace_id = f"trace_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now(timezone.utc)
         self._current_trace = MockTrace(
-            trace_id=trace_id,
+            trace_id=f"trace_{now:%Y%m%d%H%M%S}",
             name=name,
             group_id=None,
             metadata=metadata or {},
-            start_time=datetime.now(timezone.utc),
+            start_time=now,
         )
         if self._processor:
             self._processor.on_trace_start(self._current_trace)
@@ -93,14 +93,15 @@ class MockTraceManager:
         if not self._current_trace:
             raise RuntimeError("No active trace")
 
+        now = datetime.now(timezone.utc)
         span = MockSpan(
             span_id=f"span_{len(self._current_trace.spans)}",
             trace_id=self._current_trace.trace_id,
             parent_span_id=None,
             span_type=span_type,
             name=name,
-            start_time=datetime.now(timezone.utc),
-            end_time=datetime.now(timezone.utc),
+            start_time=now,
+            end_time=now,
             attributes=attributes,
         )
         self._current_trace.spans.append(span)
@@ -144,14 +145,18 @@ def get_account(account_id: str) -> dict:
     }
 
 
+# Static knowledge base response, built once (callers only read it)
+_SEARCH_KB_RESULT = {
+    "results": [
+        {"title": "Service Credit Policy", "snippet": "Credits up to 10% can be auto-approved..."},
+        {"title": "Escalation Procedures", "snippet": "Enterprise accounts require manager approval..."},
+    ]
+}
+
+
 def search_knowledge(query: str) -> dict:
     """Search knowledge base (read operation)."""
-    return {
-        "results": [
-            {"title": "Service Credit Policy", "snippet": "Credits up to 10% can be auto-approved..."},
-            {"title": "Escalation Procedures", "snippet": "Enterprise accounts require manager approval..."},
-        ]
-    }
+    return _SEARCH_KB_RESULT
 
 
 def send_email(to: str, subject: str, body: str) -> dict:
@@ -176,6 +181,23 @@ def create_ticket(title: str, description: str, priority: str) -> dict:
 # Simulated Agent Run
 # =============================================================================
 
+# The simulated calls always use the same arguments, so their JSON is rendered
+# once here rather than on every run
+_SPAN_ARGUMENTS = {
+    "get_account": json.dumps({"account_id": "ACC-ACME-001"}),
+    "search_knowledge": json.dumps({"query": "service credit policy"}),
+    "send_email": json.dumps({
+        "to": "john@acme.com",
+        "subject": "Your Service Credit Request",
+        "body": "Dear customer...",
+    }),
+    "create_ticket": json.dumps({
+        "title": "Follow-up: Acme service credit",
+        "description": "Schedule call to discuss renewal",
+        "priority": "medium",
+    }),
+}
+
 def simulate_agent_run():
     """Simulate what happens when an OpenAI Agent runs with tools."""
 
@@ -188,6 +210,9 @@ def simulate_agent_run():
     )
     logger.info(f"Trace started: {trace.trace_id}")
 
+    # The SDK records arguments as the model's JSON string but keeps the tool's
+    # return value as-is, so outputs are passed through without a dumps/loads trip.
+
     # Agent decides to look up account info (READ)
     logger.info("Agent calling get_account...")
     account = get_account("ACC-ACME-001")
@@ -196,8 +221,8 @@ def simulate_agent_run():
         name="get_account",
         attributes={
             "function.name": "get_account",
-            "function.arguments": json.dumps({"account_id": "ACC-ACME-001"}),
-            "function.output": json.dumps(account),
+            "function.arguments": _SPAN_ARGUMENTS["get_account"],
+            "function.output": account,
         }
     )
 
@@ -209,8 +234,8 @@ def simulate_agent_run():
         name="search_knowledge",
         attributes={
             "function.name": "search_knowledge",
-            "function.arguments": json.dumps({"query": "service credit policy"}),
-            "function.output": json.dumps(kb_results),
+            "function.arguments": _SPAN_ARGUMENTS["search_knowledge"],
+            "function.output": kb_results,
         }
     )
 
@@ -226,12 +251,8 @@ def simulate_agent_run():
         name="send_email",
         attributes={
             "function.name": "send_email",
-            "function.arguments": json.dumps({
-                "to": "john@acme.com",
-                "subject": "Your Service Credit Request",
-                "body": "Dear customer..."
-            }),
-            "function.output": json.dumps(email_result),
+            "function.arguments": _SPAN_ARGUMENTS["send_email"],
+            "function.output": email_result,
         }
     )
 
@@ -247,12 +268,8 @@ def simulate_agent_run():
         name="create_ticket",
         attributes={
             "function.name": "create_ticket",
-            "function.arguments": json.dumps({
-                "title": "Follow-up: Acme service credit",
-                "description": "Schedule call to discuss renewal",
-                "priority": "medium"
-            }),
-            "function.output": json.dumps(ticket_result),
+            "function.arguments": _SPAN_ARGUMENTS["create_ticket"],
+            "function.output": ticket_result,
         }
     )
 
@@ -2,18 +2,139 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import gzip
+import io
 import logging
+import queue
+import sys
+import threading
+import time
 import urllib.request
+from collections import deque
 import urllib.error
+import urllib.parse
 from datetime import datetime
 from typing import Optional, Any
 
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - optional dependency
+    urllib3 = None
+
+from contextgraph.core import _json
 from contextgraph.core.config import Config
 from contextgraph.core.models import DecisionRecord, Evidence, Action, Outcome
 
 logger = logging.getLogger(__name__)
 
+_SHUTDOWN = object()
+
+# Background retry of failed ingests backs off 0.5s, 1s, 2s, ... up to a minute
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_BACKOFF_MAX = 60.0
+
+# Bodies smaller than this are sent uncompressed even with compress_requests
+_GZIP_MIN_BYTES = 1024
+
+_DECISION_COLUMNS = (
+    "decision_id, run_id, tenant_id, trace_id, timestamp, actor_type, actor_id, "
+    "outcome, outcome_reason, subject_entities, evidence, policies, approvals, actions, metadata"
+)
+_INSERT_DECISION_SQL = """
+    INSERT INTO decision_records
+    ({columns})
+    {source}
+    ON CONFLICT (decision_id) DO UPDATE SET
+        outcome = EXCLUDED.outcome,
+        outcome_reason = EXCLUDED.outcome_reason,
+        evidence = EXCLUDED.evidence,
+        policies = EXCLUDED.policies,
+        approvals = EXCLUDED.approvals,
+        actions = EXCLUDED.actions,
+        updated_at = NOW()
+"""
+_INSERT_ONE_SQL = _INSERT_DECISION_SQL.format(
+    columns=_DECISION_COLUMNS, source="VALUES (" + ", ".join(["%s"] * 15) + ")"
+)
+_INSERT_MANY_SQL = _INSERT_DECISION_SQL.format(columns=_DECISION_COLUMNS, source="VALUES %s")
+
+# Local batches at least this large are loaded with COPY into a staging table
+COPY_THRESHOLD = 500
+_CREATE_STAGING_SQL = (
+    "CREATE TEMP TABLE IF NOT EXISTS contextgraph_staging "
+    "(LIKE decision_records INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+_COPY_STAGING_SQL = f"COPY contextgraph_staging ({_DECISION_COLUMNS}) FROM STDIN WITH (FORMAT csv)"
+_INSERT_FROM_STAGING_SQL = _INSERT_DECISION_SQL.format(
+    columns=_DECISION_COLUMNS, source=f"SELECT {_DECISION_COLUMNS} FROM contextgraph_staging"
+)
+
+
+def _csv_field(value: Optional[str]) -> str:
+    # Unquoted empty is NULL in COPY csv; anything else is quoted so "" stays ""
+    if value is None:
+        return ""
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _json_default(obj: Any) -> Any:
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a JSON payload.
+
+    Model dataclasses can be passed directly: orjson serializes them natively,
+    and the stdlib fallback goes through their to_dict().
+    """
+    return _json.dumps(obj, default=_json_default)
+
+
+_http_pool_lock = threading.Lock()
+# Keyed by proxy URL, with None for direct connections
+_http_pools: dict = {}
+
+
+def _proxy_for(url: str) -> Optional[str]:
+    """Return the proxy urllib would use for ``url``, honoring *_PROXY and NO_PROXY."""
+    parts = urllib.parse.urlsplit(url)
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ""):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _shared_http_pool(url: str):
+    """Return the process-wide keep-alive pool for ``url``, creating it on first use.
+
+    Integrations build a client per agent run, so a per-client pool would
+    start every run with a fresh TCP/TLS handshake. Returns None when the
+    configured proxy is one urllib3 cannot speak to, leaving urllib in charge.
+    """
+    proxy = _proxy_for(url)
+    if proxy is not None and urllib.parse.urlsplit(proxy).scheme not in ("http", "https"):
+        return None
+    with _http_pool_lock:
+        pool = _http_pools.get(proxy)
+        if pool is None:
+            options = dict(num_pools=4, maxsize=8, retries=urllib3.Retry(total=2, backoff_factor=0.1))
+            if proxy is None:
+                pool = urllib3.PoolManager(**options)
+            else:
+                auth = urllib3.util.parse_url(proxy).auth
+                pool = urllib3.ProxyManager(
+                    proxy,
+                    proxy_headers=urllib3.make_headers(proxy_basic_auth=auth) if auth else None,
+                    **options,
+                )
+            _http_pools[proxy] = pool
+        return pool
+
 
 class ContextGraphError(Exception):
     """Base exception for ContextGraph errors."""
@@ -26,8 +147,14 @@ class ConnectionError(ContextGraphError):
 
 
 class IngestError(ContextGraphError):
-    """Failed to ingest a decision record."""
-    pass
+    """Failed to ingest a decision record.
+
+    ``status`` is the HTTP status code when the server rejected the request.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
 
 
 class ContextGraphClient:
@@ -52,7 +179,32 @@ class ContextGraphClient:
         self._pending_events: list[dict] = []
         self._current_decision: Optional[DecisionRecordBuilder] = None
         self._connection = None
-        self._failed_ingests: list[DecisionRecord] = []
+        self._failed_ingests: deque[DecisionRecord] = deque(maxlen=max(1, self.config.max_failed))
+        self._failed_lock = threading.Lock()
+        self._retry_attempts = 0
+        self._next_retry = 0.0
+        self._dropped = 0
+        # Cleared if the server turns out not to have the batch route
+        self._batch_endpoint = self.config.batch_endpoint
+        self._queue: Optional[queue.Queue] = None
+        self._worker_thread: Optional[threading.Thread] = None
+        self._http = None
+
+        if urllib3 is not None and not self.config.local_mode:
+            # Keep-alive pool so successive POSTs reuse the same socket
+            self._http = _shared_http_pool(self.config.server_url)
+
+        if self.config.async_ingest:
+            self._queue = queue.Queue(maxsize=self.config.queue_size)
+            self._worker_thread = threading.Thread(
+                target=self._worker,
+                args=(self._queue,),
+                name="contextgraph-ingest",
+                daemon=True,
+            )
+            self._worker_thread.start()
+            # Deliver whatever is still queued when the interpreter exits
+            atexit.register(self.close)
 
         if self.config.local_mode and self.config.postgres_url:
             self._init_local_storage()
@@ -62,11 +214,11 @@ class ContextGraphClient:
         try:
             import psycopg2
             self._connection = psycopg2.connect(self.config.postgres_url)
-            logger.info(f"Connected to local postgres: {self.config.postgres_url}")
+            logger.info("Connected to local postgres: %s", self.config.postgres_url)
         except ImportError:
             logger.warning("psycopg2 not installed, local mode disabled. Install with: pip install psycopg2-binary")
         except Exception as e:
-            logger.error(f"Failed to connect to postgres: {e}")
+            logger.error("Failed to connect to postgres: %s", e)
 
     def start_decision(self, run_id: str, actor_id: Optional[str] = None, actor_type: str = "agent") -> "DecisionRecordBuilder":
         """Start building a new decision record.
@@ -83,14 +235,23 @@ class ContextGraphClient:
         return self._current_decision
 
     def ingest_event(self, event: dict):
-        """Ingest a raw event."""
+        """Ingest a raw event. A batch_size of 0 or less disables event buffering."""
+        if self.config.batch_size <= 0:
+            return
         self._pending_events.append(event)
         if len(self._pending_events) >= self.config.batch_size:
-            self.flush()
+            self._flush_events()
+
+    def _flush_events(self):
+        # There is no events endpoint yet, so buffered events are discarded
+        self._pending_events.clear()
 
     def ingest_decision(self, decision: DecisionRecord) -> bool:
         """Ingest a complete decision record.
 
+        With ``async_ingest`` enabled the record is only enqueued for the
+        background worker, and the return value reports whether it was queued.
+
         Args:
             decision: The DecisionRecord to ingest
 
@@ -100,85 +261,310 @@ class ContextGraphClient:
         Raises:
             IngestError: If ingestion fails and raise_on_error is True in config
         """
+        # Snapshot the queue: close() may clear it from another thread
+        q = self._queue
+        if q is not None:
+            try:
+                q.put_nowait(decision)
+                return True
+            except queue.Full:
+                with self._failed_lock:
+                    self._dropped += 1
+                logger.warning("Ingest queue full, dropping decision %s", decision.decision_id)
+                return False
+        return self._ingest_now(decision)
+
+    def ingest_decisions(self, decisions: list[DecisionRecord]) -> bool:
+        """Ingest several decision records, batching delivery where possible.
+
+        With ``batch_endpoint`` (or ``local_mode``) the records go out
+        batch_size at a time in one request (or one INSERT) each, instead of
+        one round trip per record. With ``async_ingest`` they are only enqueued.
+
+        Args:
+            decisions: The DecisionRecords to ingest
+
+        Returns:
+            True if every record was delivered (or queued), False otherwise
+
+        Raises:
+            IngestError: If any record fails and raise_on_error is True in config
+        """
+        if self._queue is not None:
+            # ingest_decision re-checks the queue, so a concurrent close()
+            # only sends the remaining records inline
+            queued = [self.ingest_decision(d) for d in decisions]
+            return all(queued)
+        batch_size = max(1, self.config.batch_size)
+        ok = True
+        for start in range(0, len(decisions), batch_size):
+            ok = self._ingest_batch(decisions[start:start + batch_size]) and ok
+        if not ok and self.config.raise_on_error:
+            raise IngestError("Failed to ingest one or more decisions")
+        return ok
+
+    async def aingest_decision(self, decision: DecisionRecord) -> bool:
+        """Ingest a decision record from async code.
+
+        Enqueueing for the background worker never blocks, so it happens
+        inline; synchronous delivery is moved to a thread so the event loop
+        keeps running during the round trip.
+
+        Args:
+            decision: The DecisionRecord to ingest
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._queue is not None:
+            return self.ingest_decision(decision)
+        return await asyncio.to_thread(self._ingest_now, decision)
+
+    def _ingest_now(self, decision: DecisionRecord) -> bool:
+        """Deliver a decision on the calling thread."""
         try:
             if self.config.local_mode:
                 self._store_local(decision)
             else:
                 self._send_to_server(decision)
-            logger.debug(f"Ingested decision {decision.decision_id}")
+            logger.debug("Ingested decision %s", decision.decision_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to ingest decision {decision.decision_id}: {e}")
-            self._failed_ingests.append(decision)
+            logger.error("Failed to ingest decision %s: %s", decision.decision_id, e)
+            self._record_failed([decision])
             if getattr(self.config, 'raise_on_error', False):
                 raise IngestError(f"Failed to ingest decision: {e}") from e
             return False
 
+    def _worker(self, q: queue.Queue):
+        """Drain the ingest queue until the shutdown sentinel arrives.
+
+        Whatever is already queued (up to batch_size) is delivered together,
+        so bursts are batched without delaying a lone decision. The queue is
+        passed in because close() clears ``self._queue``.
+        """
+        batch_size = max(1, self.config.batch_size)
+        while True:
+            try:
+                batch = [q.get(timeout=self._retry_wait())]
+            except queue.Empty:
+                self._retry_with_backoff()
+                continue
+            while batch[-1] is not _SHUTDOWN and len(batch) < batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            shutdown = batch[-1] is _SHUTDOWN
+            decisions = batch[:-1] if shutdown else batch
+            try:
+                if decisions:
+                    self._ingest_batch(decisions)
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if shutdown:
+                return
+
+    def _retry_wait(self) -> Optional[float]:
+        """Seconds until the next background retry, or None to block."""
+        if not self._failed_ingests:
+            return None
+        return max(0.0, self._next_retry - time.monotonic())
+
+    def _retry_with_backoff(self):
+        self.retry_failed()
+        if self._failed_ingests:
+            self._retry_attempts += 1
+        else:
+            self._retry_attempts = 0
+        self._schedule_retry()
+
+    def _schedule_retry(self):
+        delay = min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_BASE * 2 ** self._retry_attempts)
+        self._next_retry = time.monotonic() + delay
+
+    def _record_failed(self, decisions: list[DecisionRecord]):
+        """Keep decisions for retry, evicting the oldest once max_failed is reached."""
+        with self._failed_lock:
+            if not self._failed_ingests:
+                self._schedule_retry()
+            for decision in decisions:
+                if len(self._failed_ingests) == self._failed_ingests.maxlen:
+                    evicted = self._failed_ingests[0]
+                    self._dropped += 1
+                    if self._dropped == 1 or self._dropped % 1000 == 0:
+                        logger.warning(
+                            "Retry buffer full, dropping decision %s (%s dropped so far)",
+                            evicted.decision_id, self._dropped,
+                        )
+                self._failed_ingests.append(decision)
+
+    def _ingest_batch(self, decisions: list[DecisionRecord]) -> bool:
+        """Deliver decisions, never raising; returns whether all succeeded.
+
+        Re-submissions of a decision_id within the batch are collapsed to the
+        latest one, since the server upserts by decision_id anyway.
+        """
+        latest = {d.decision_id: d for d in decisions}
+        if len(latest) < len(decisions):
+            logger.debug("Collapsed %s duplicate decisions in batch", len(decisions) - len(latest))
+            decisions = list(latest.values())
+        if len(decisions) > 1 and (self.config.local_mode or self._batch_endpoint):
+            try:
+                if self.config.local_mode:
+                    self._store_local_batch(decisions)
+                else:
+                    self._send_batch(decisions)
+                logger.debug("Ingested batch of %s decisions", len(decisions))
+                return True
+            except IngestError as e:
+                if e.status in (404, 405):
+                    # Older server without /v1/decisions/batch
+                    logger.warning("Server has no batch endpoint, sending decisions individually")
+                    self._batch_endpoint = False
+                elif e.status is None or not 400 <= e.status < 500:
+                    logger.error("Failed to ingest batch of %s decisions: %s", len(decisions), e)
+                    self._record_failed(decisions)
+                    return False
+                # Any other 4xx rejects the whole batch; send the records one
+                # by one so a single invalid record cannot hold back the rest
+            except Exception as e:
+                logger.error("Failed to ingest batch of %s decisions: %s", len(decisions), e)
+                self._record_failed(decisions)
+                return False
+        ok = True
+        for decision in decisions:
+            try:
+                ok = self._ingest_now(decision) and ok
+            except IngestError:
+                ok = False  # already logged and kept for retry_failed()
+        return ok
+
     def _store_local(self, decision: DecisionRecord):
         """Store decision in local postgres."""
         if not self._connection:
             raise ConnectionError("No local database connection")
 
         cursor = self._connection.cursor()
-        data = decision.to_dict()
         try:
-            cursor.execute(
-                """
-                INSERT INTO decision_records
-                (decision_id, run_id, tenant_id, trace_id, timestamp, actor_type, actor_id,
-                 outcome, outcome_reason, subject_entities, evidence, policies, approvals, actions, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (decision_id) DO UPDATE SET
-                    outcome = EXCLUDED.outcome,
-                    outcome_reason = EXCLUDED.outcome_reason,
-                    evidence = EXCLUDED.evidence,
-                    policies = EXCLUDED.policies,
-                    approvals = EXCLUDED.approvals,
-                    actions = EXCLUDED.actions,
-                    updated_at = NOW()
-                """,
-                (
-                    data["decision_id"],
-                    data["run_id"],
-                    self.config.tenant_id,
-                    data.get("trace_id"),
-                    data["timestamp"],
-                    data["actor"]["type"] if data.get("actor") else None,
-                    data["actor"]["id"] if data.get("actor") else None,
-                    data["outcome"],
-                    data.get("outcome_reason"),
-                    json.dumps(data.get("subject_entities", [])),
-                    json.dumps(data.get("evidence", [])),
-                    json.dumps(data.get("policies", [])),
-                    json.dumps(data.get("approvals", [])),
-                    json.dumps(data.get("actions", [])),
-                    json.dumps(data.get("metadata", {})),
-                )
-            )
+            cursor.execute(_INSERT_ONE_SQL, self._local_row(decision))
+            self._connection.commit()
+        except Exception as e:
+            self._connection.rollback()
+            raise IngestError(f"Database error: {e}") from e
+
+    def _store_local_batch(self, decisions: list[DecisionRecord]):
+        """Store several decisions in local postgres with one multi-row INSERT."""
+        if not self._connection:
+            raise ConnectionError("No local database connection")
+
+        from psycopg2.extras import execute_values
+
+        # A single INSERT ... ON CONFLICT cannot touch the same row twice
+        latest = {d.decision_id: d for d in decisions}
+        rows = [self._local_row(d) for d in latest.values()]
+        cursor = self._connection.cursor()
+        try:
+            if len(rows) >= COPY_THRESHOLD:
+                self._copy_rows(cursor, rows)
+            else:
+                execute_values(cursor, _INSERT_MANY_SQL, rows, page_size=100)
             self._connection.commit()
         except Exception as e:
             self._connection.rollback()
             raise IngestError(f"Database error: {e}") from e
 
+    def _copy_rows(self, cursor, rows: list[tuple]):
+        """Load rows via COPY into a staging table, then upsert them.
+
+        Falls back to execute_values inside a savepoint if COPY fails.
+        """
+        import psycopg2
+        from psycopg2.extras import execute_values
+
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(",".join(_csv_field(v) for v in row))
+            buf.write("\n")
+        buf.seek(0)
+
+        cursor.execute("SAVEPOINT contextgraph_copy")
+        try:
+            cursor.execute(_CREATE_STAGING_SQL)
+            cursor.copy_expert(_COPY_STAGING_SQL, buf)
+            cursor.execute(_INSERT_FROM_STAGING_SQL)
+            cursor.execute("RELEASE SAVEPOINT contextgraph_copy")
+        except psycopg2.Error as e:
+            logger.warning("COPY load failed, falling back to INSERT: %s", e)
+            cursor.execute("ROLLBACK TO SAVEPOINT contextgraph_copy")
+            execute_values(cursor, _INSERT_MANY_SQL, rows, page_size=100)
+
+    def _local_row(self, decision: DecisionRecord) -> tuple:
+        """Build the INSERT parameters for a decision record."""
+        actor = decision.actor
+        return (
+            decision.decision_id,
+            decision.run_id,
+            self.config.tenant_id,
+            decision.trace_id,
+            decision.timestamp.isoformat(),
+            actor.type.value if actor else None,
+            actor.id if actor else None,
+            decision.outcome.value,
+            decision.outcome_reason,
+            _dumps(decision.subject_entities).decode('utf-8'),
+            _dumps(decision.evidence).decode('utf-8'),
+            _dumps(decision.policies).decode('utf-8'),
+            _dumps(decision.approvals).decode('utf-8'),
+            _dumps(decision.actions).decode('utf-8'),
+            _dumps(decision.metadata).decode('utf-8'),
+        )
+
     def _send_to_server(self, decision: DecisionRecord):
         """Send decision to ContextGraph server."""
-        url = f"{self.config.server_url}/v1/decisions"
-        data = json.dumps(decision.to_dict()).encode('utf-8')
+        return self._post("/v1/decisions", _dumps(decision))
+
+    def _send_batch(self, decisions: list[DecisionRecord]):
+        """Send several decisions to ContextGraph server in one request."""
+        data = _dumps(decisions)
+        return self._post("/v1/decisions/batch", data)
+
+    def _post(self, path: str, data: bytes):
+        """POST a JSON body to the server and return the decoded response."""
+        url = f"{self.config.server_url}{path}"
 
         headers = {"Content-Type": "application/json"}
+        if self.config.compress_requests and len(data) >= _GZIP_MIN_BYTES:
+            data = gzip.compress(data, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
         if self.config.api_key:
             headers["Authorization"] = f"Bearer {self.config.api_key}"
 
+        if self._http is not None:
+            try:
+                response = self._http.request(
+                    "POST", url, body=data, headers=headers, timeout=self.config.timeout
+                )
+            except urllib3.exceptions.HTTPError as e:
+                raise ConnectionError(f"Failed to connect to {url}: {e}") from e
+            if response.status >= 400:
+                raise IngestError(
+                    f"HTTP {response.status}: {response.data.decode('utf-8', 'replace')}",
+                    status=response.status,
+                )
+            return _json.loads(response.data)
+
         req = urllib.request.Request(url, data=data, headers=headers, method="POST")
 
         try:
             with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
                 if response.status >= 400:
-                    raise IngestError(f"Server returned {response.status}")
-                return json.loads(response.read().decode('utf-8'))
+                    raise IngestError(f"Server returned {response.status}", status=response.status)
+                return _json.loads(response.read())
         except urllib.error.HTTPError as e:
             body = e.read().decode('utf-8') if e.fp else ""
-            raise IngestError(f"HTTP {e.code}: {body}") from e
+            raise IngestError(f"HTTP {e.code}: {body}", status=e.code) from e
         except urllib.error.URLError as e:
             raise ConnectionError(f"Failed to connect to {url}: {e.reason}") from e
 
@@ -188,34 +574,75 @@ class ContextGraphClient:
         Returns:
             Number of successfully retried ingests
         """
-        if not self._failed_ingests:
+        with self._failed_lock:
+            pending = list(self._failed_ingests)
+            self._failed_ingests.clear()
+        if not pending:
             return 0
 
         succeeded = 0
         still_failed = []
 
-        for decision in self._failed_ingests:
+        for decision in pending:
             try:
                 if self.config.local_mode:
                     self._store_local(decision)
                 else:
                     self._send_to_server(decision)
                 succeeded += 1
-                logger.info(f"Retry succeeded for decision {decision.decision_id}")
+                logger.info("Retry succeeded for decision %s", decision.decision_id)
             except Exception as e:
-                logger.warning(f"Retry failed for decision {decision.decision_id}: {e}")
+                logger.warning("Retry failed for decision %s: %s", decision.decision_id, e)
                 still_failed.append(decision)
 
-        self._failed_ingests = still_failed
+        if still_failed:
+            self._record_failed(still_failed)
         return succeeded
 
     def flush(self):
-        """Flush pending events."""
-        self._pending_events.clear()
+        """Flush pending events and wait for queued decisions to be delivered.
+
+        Waits at most ``config.timeout``, and stops waiting if the worker
+        thread is no longer running.
+        """
+        self._flush_events()
+        worker, q = self._worker_thread, self._queue
+        if worker is None or q is None:
+            return
+        deadline = time.monotonic() + self.config.timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                if not worker.is_alive():
+                    logger.warning("Ingest worker is not running, %s queued decisions not delivered",
+                                   q.unfinished_tasks)
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Timed out waiting for %s queued decisions", q.unfinished_tasks)
+                    return
+                q.all_tasks_done.wait(min(remaining, 0.1))
 
     def close(self):
         """Close the client and release resources."""
-        self.flush()
+        worker = self._worker_thread
+        if worker is not None:
+            atexit.unregister(self.close)
+            try:
+                self._queue.put(_SHUTDOWN, timeout=self.config.timeout)
+            except queue.Full:
+                logger.warning("Ingest queue full on close, abandoning queued decisions")
+            worker.join(timeout=self.config.timeout)
+            if worker.is_alive():
+                # Leave the queue in place: the worker still owns it and may
+                # be holding dequeued records
+                logger.warning("Ingest worker did not finish within timeout")
+            else:
+                self._worker_thread = None
+                # Nothing drains the queue any more; deliver later calls inline
+                self._queue = None
+        self._flush_events()
+        # The pool is shared with other clients, so only drop our reference
+        self._http = None
         if self._connection:
             try:
                 self._connection.close()
@@ -228,6 +655,11 @@ class ContextGraphClient:
         """Number of failed ingests waiting for retry."""
         return len(self._failed_ingests)
 
+    @property
+    def dropped_count(self) -> int:
+        """Number of decisions dropped because the ingest queue or retry buffer was full."""
+        return self._dropped
+
 
 class DecisionRecordBuilder:
     """Builder for constructing decision records incrementally.
@@ -263,6 +695,7 @@ class DecisionRecordBuilder:
         Returns:
             self for method chaining
         """
+        tool_name = sys.intern(tool_name)
         self.evidence.append(Evidence(
             source=source or tool_name,
             retrieved_at=datetime.utcnow(),
@@ -285,7 +718,7 @@ class DecisionRecordBuilder:
             self for method chaining
         """
         self.actions.append(Action(
-            tool=tool_name,
+            tool=sys.intern(tool_name),
             committed_at=datetime.utcnow(),
             params=tool_args,
             result=result if isinstance(result, dict) else {"value": result},
@@ -327,7 +760,7 @@ class DecisionRecordBuilder:
         self.approvals.append({
             "approver": {"type": "human", "id": approver_id},
             "granted": granted,
-            "granted_at": datetime.utcnow().isoformat(),
+            "granted_at": datetime.utcnow(),
             "reason": reason,
         })
         return self
@@ -360,7 +793,7 @@ class DecisionRecordBuilder:
             approvals=[ApprovalModel(
                 approver=Actor(type=ActorType(a["approver"]["type"]), id=a["approver"]["id"]),
                 granted=a["granted"],
-                granted_at=datetime.fromisoformat(a["granted_at"]),
+                granted_at=a["granted_at"],
                 reason=a.get("reason")
             ) for a in self.approvals],
             outcome_reason=reason,
@@ -1,8 +1,19 @@
 """Configuration for ContextGraph client."""
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
+WRITE_PATTERNS = ("create", "update", "delete", "send", "post", "put", "patch", "write", "set", "add", "remove")
+_WRITE_PATTERN_RE = re.compile("|".join(WRITE_PATTERNS))
+
+
+@lru_cache(maxsize=1024)
+def _looks_like_write(tool_name: str) -> bool:
+    """Name-based write heuristic; pure, so cached per tool name."""
+    return _WRITE_PATTERN_RE.search(tool_name.lower()) is not None
+
 
 @dataclass
 class Config:
@@ -21,9 +32,20 @@ class Config:
     batch_size: int = 100
     flush_interval_seconds: float = 5.0
 
+    # Background ingestion: when enabled, ingest_decision only enqueues and a
+    # daemon thread delivers records; decisions are dropped once queue_size is hit
+    async_ingest: bool = False
+    queue_size: int = 10000
+    # Deliver queued decisions up to batch_size at a time via /v1/decisions/batch
+    batch_endpoint: bool = False
+
     # Network
     timeout: float = 30.0
     raise_on_error: bool = False
+    # Gzip request bodies over 1 KB (server must accept Content-Encoding: gzip)
+    compress_requests: bool = False
+    # Failed ingests kept for retry; the oldest are dropped beyond this
+    max_failed: int = 10000
 
     # Storage (for local mode)
     postgres_url: Optional[str] = None
@@ -35,9 +57,7 @@ class Config:
         if tool_name in self.read_tools:
             return False
         # Heuristics for common patterns
-        write_patterns = ["create", "update", "delete", "send", "post", "put", "patch", "write", "set", "add", "remove"]
-        tool_lower = tool_name.lower()
-        return any(p in tool_lower for p in write_patterns)
+        return _looks_like_write(tool_name)
 
     def is_read_tool(self, tool_name: str) -> bool:
         return not self.is_write_tool(tool_name)
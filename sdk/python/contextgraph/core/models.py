@@ -37,7 +37,7 @@ class PolicyResult(str, Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityRef:
     namespace: str
     type: str
@@ -48,7 +48,7 @@ class EntityRef:
         return {"namespace": self.namespace, "type": self.type, "id": self.id, "aliases": self.aliases}
 
 
-@dataclass
+@dataclass(slots=True)
 class Actor:
     type: ActorType
     id: str
@@ -58,7 +58,7 @@ class Actor:
         return {"type": self.type.value, "id": self.id, "name": self.name}
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     source: str
     retrieved_at: datetime
@@ -86,7 +86,7 @@ class Evidence:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyEval:
     policy_id: str
     version: str
@@ -104,7 +104,7 @@ class PolicyEval:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Approval:
     approver: Actor
     granted: bool
@@ -122,7 +122,7 @@ class Approval:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     tool: str
     committed_at: datetime
@@ -146,7 +146,7 @@ class Action:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionRecord:
     run_id: str
     outcome: Outcome
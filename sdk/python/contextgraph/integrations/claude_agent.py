@@ -19,12 +19,15 @@ See: https://github.com/anthropics/claude-agent-sdk-python
 
 from __future__ import annotations
 
+import inspect
+import json
 import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from contextgraph.core import _json
 from contextgraph.core.client import ContextGraphClient
 from contextgraph.core.models import (
     DecisionRecord, Evidence, Action, PolicyEval, Approval, Outcome, PolicyResult,
@@ -39,7 +42,7 @@ if TYPE_CHECKING:
     pass  # Claude SDK types would go here
 
 
-@dataclass
+@dataclass(slots=True)
 class _RunAccumulator:
     """Internal state for accumulating tool calls into a DecisionRecord."""
     run_id: str
@@ -89,6 +92,8 @@ class ContextGraphPreToolUseHook:
             for policy_id, policy_fn in self.policies.items():
                 try:
                     result = policy_fn(tool_name, tool_input, kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
                     passed = result.get("passed", True) if isinstance(result, dict) else bool(result)
                     message = result.get("message") if isinstance(result, dict) else None
 
@@ -104,11 +109,11 @@ class ContextGraphPreToolUseHook:
                             "tool": tool_name,
                             "reason": message,
                         })
-                        logger.info(f"Policy {policy_id} blocked tool {tool_name}: {message}")
+                        logger.info("Policy %s blocked tool %s: %s", policy_id, tool_name, message)
                         return {"allow": False, "reason": message or "Policy check failed"}
 
                 except Exception as e:
-                    logger.warning(f"Policy {policy_id} error: {e}")
+                    logger.warning("Policy %s error: %s", policy_id, e)
                     self.accumulator.policies.append(PolicyEval(
                         policy_id=policy_id,
                         version="1.0",
@@ -119,7 +124,7 @@ class ContextGraphPreToolUseHook:
             return {"allow": True}
 
         except Exception as e:
-            logger.error(f"PreToolUse hook error: {e}")
+            logger.error("PreToolUse hook error: %s", e)
             return {"allow": True}  # Fail open
 
 
@@ -130,6 +135,10 @@ class ContextGraphPostToolUseHook:
     - Record tool outputs as evidence (read operations)
     - Record tool outputs as actions (write operations)
     - Track errors
+
+    Dict inputs and outputs are recorded by reference, not copied, and are
+    serialized only when the DecisionRecord is delivered (possibly on the
+    background ingest thread). Do not mutate them after the hook returns.
     """
 
     def __init__(self, accumulator: _RunAccumulator, config: Config):
@@ -154,13 +163,18 @@ class ContextGraphPostToolUseHook:
             now = datetime.now(timezone.utc)
 
             # Parse output
+            if isinstance(tool_output, (bytes, bytearray, memoryview)):
+                tool_output = bytes(tool_output).decode("utf-8", "replace")
+
             output_data = tool_output
             if isinstance(tool_output, str):
-                try:
-                    import json
-                    output_data = json.loads(tool_output)
-                except (json.JSONDecodeError, TypeError):
-                    output_data = {"output": tool_output}
+                output_data = {"output": tool_output}
+                # Only attempt a parse when the output could be a JSON document
+                if tool_output.lstrip()[:1] in ("{", "["):
+                    try:
+                        output_data = _json.loads(tool_output)
+                    except (json.JSONDecodeError, TypeError):
+                        pass
             elif not isinstance(tool_output, dict):
                 output_data = {"value": tool_output}
 
@@ -187,7 +201,7 @@ class ContextGraphPostToolUseHook:
             return {}  # No modification
 
         except Exception as e:
-            logger.error(f"PostToolUse hook error: {e}")
+            logger.error("PostToolUse hook error: %s", e)
             return {}
 
 
@@ -251,13 +265,13 @@ class ContextGraphStopHook:
                 approvals=self.accumulator.approvals,
             )
 
-            self.client.ingest_decision(record)
-            logger.info(f"Created DecisionRecord {record.decision_id}")
+            await self.client.aingest_decision(record)
+            logger.info("Created DecisionRecord %s", record.decision_id)
 
             return {"allow": True}
 
         except Exception as e:
-            logger.error(f"Stop hook error: {e}")
+            logger.error("Stop hook error: %s", e)
             return {"allow": True}
 
 
@@ -276,12 +290,15 @@ def contextgraph_hooks(
 
     Args:
         client: Optional pre-configured ContextGraphClient
-        config: Optional Config object
+        config: Optional Config object. The Stop hook delivers through
+            aingest_decision, so a synchronous client sends from a worker
+            thread instead of blocking the agent's event loop.
         write_tools: List of tool names that are write operations (actions)
         read_tools: List of tool names that are read operations (evidence)
         policies: Dict of policy_id -> policy_fn for pre-tool checks
             Policy functions receive (tool_name, tool_input, context) and return
-            {"passed": bool, "message": str}
+            {"passed": bool, "message": str}. They may be async (e.g. a remote
+            policy service); policies run in order and stop at the first failure.
         server_url: URL of the ContextGraph server
         agent_name: Name to use for the agent actor
 
@@ -17,11 +17,14 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional, Iterator, Sequence, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from contextgraph.core import _json
 from contextgraph.core.client import ContextGraphClient
 from contextgraph.core.models import (
     DecisionRecord, Evidence, Action, Approval, Outcome,
@@ -31,12 +34,22 @@ from contextgraph.core.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Values that are already JSON-safe and need no normalizing round-trip
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+_ACTION_NODE_RE = re.compile("write|send|create|update|delete|post|put|execute")
+
+
+@lru_cache(maxsize=256)
+def _is_action_node_name(node_name: str) -> bool:
+    return _ACTION_NODE_RE.search(node_name.lower()) is not None
+
 # Type checking - actual types from LangGraph
 if TYPE_CHECKING:
     from langgraph.checkpoint.base import BaseCheckpointSaver
 
 
-@dataclass
+@dataclass(slots=True)
 class _ThreadAccumulator:
     """Internal state for accumulating checkpoint data into a DecisionRecord."""
     thread_id: str
@@ -46,7 +59,13 @@ class _ThreadAccumulator:
     approvals: list[Approval] = field(default_factory=list)
     last_step: int = 0
     pending_interrupt: bool = False
+    # Tool-call ids; kept for the thread's lifetime since every checkpoint
+    # replays the full message history
     seen_ids: set = field(default_factory=set)
+    # State/node ids embed the step, so they only need deduping within a step
+    step_seen: set = field(default_factory=set)
+    # Encoded form of the last snapshot recorded per state key, to skip unchanged state
+    last_state: dict = field(default_factory=dict)
 
 
 class ContextGraphCheckpointer:
@@ -86,7 +105,8 @@ class ContextGraphCheckpointer:
         Args:
             underlying: The actual LangGraph checkpointer to wrap (e.g., MemorySaver)
             client: Optional pre-configured ContextGraphClient
-            config: Optional Config object
+            config: Optional Config object. Use afinalize_thread() from async
+                graphs so delivery does not block the event loop.
             write_tools: List of tool names that are write operations (actions)
             read_tools: List of tool names that are read operations (evidence)
             server_url: URL of the ContextGraph server
@@ -115,12 +135,15 @@ class ContextGraphCheckpointer:
     def _get_accumulator(self, config: dict) -> _ThreadAccumulator:
         """Get or create accumulator for a thread."""
         thread_id = self._get_thread_id(config)
-        if thread_id not in self._threads:
-            self._threads[thread_id] = _ThreadAccumulator(
+        accumulator = self._threads.get(thread_id)
+        if accumulator is None:
+            # setdefault is atomic, so concurrent first calls for a thread
+            # all get the same accumulator instead of overwriting each other
+            accumulator = self._threads.setdefault(thread_id, _ThreadAccumulator(
                 thread_id=thread_id,
                 start_time=datetime.now(timezone.utc),
-            )
-        return self._threads[thread_id]
+            ))
+        return accumulator
 
     # ==========================================================================
     # Checkpointer interface methods (delegate to underlying)
@@ -149,84 +172,105 @@ class ContextGraphCheckpointer:
         new_versions: dict[str, int],
     ) -> dict:
         """Store checkpoint and extract decision data."""
+        self._record_checkpoint(config, checkpoint, metadata)
+        return self.underlying.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: dict,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+    ) -> None:
+        """Store writes - delegates to underlying."""
+        return self.underlying.put_writes(config, writes, task_id)
+
+    # ==========================================================================
+    # Decision extraction logic
+    # ==========================================================================
+
+    def _record_checkpoint(self, config: dict, checkpoint: dict, metadata: Any):
+        """Extract decision data from a checkpoint; shared by put and aput."""
         try:
             accumulator = self._get_accumulator(config)
 
             # Get step from metadata (handle both dict and object)
             step = _safe_get(metadata, "step", 0)
+            if step != accumulator.last_step:
+                accumulator.step_seen.clear()
             accumulator.last_step = step
+            # Everything extracted from one checkpoint shares its timestamp
+            now = datetime.now(timezone.utc)
 
             # Extract evidence from state
             channel_values = checkpoint.get("channel_values", {})
-            self._extract_state_evidence(channel_values, accumulator)
+            self._extract_state_evidence(channel_values, accumulator, now)
 
             # Check for writes from action nodes
             writes = _safe_get(metadata, "writes", {})
             if writes:
-                self._process_writes(writes, accumulator)
+                self._process_writes(writes, accumulator, now)
 
             # Extract tool calls from messages
             messages = channel_values.get("messages", [])
             if messages:
-                self._extract_tool_calls(messages, accumulator)
+                self._extract_tool_calls(messages, accumulator, now)
 
         except Exception as e:
-            logger.warning(f"Error processing checkpoint: {e}")
-
-        return self.underlying.put(config, checkpoint, metadata, new_versions)
-
-    def put_writes(
-        self,
-        config: dict,
-        writes: Sequence[tuple[str, Any]],
-        task_id: str,
-    ) -> None:
-        """Store writes - delegates to underlying."""
-        return self.underlying.put_writes(config, writes, task_id)
+            logger.warning("Error processing checkpoint: %s", e)
 
-    # ==========================================================================
-    # Decision extraction logic
-    # ==========================================================================
-
-    def _extract_state_evidence(self, channel_values: dict, accumulator: _ThreadAccumulator):
-        """Extract configured state keys as evidence."""
+    def _extract_state_evidence(self, channel_values: dict, accumulator: _ThreadAccumulator, now: datetime):
+        """Extract configured state keys as evidence, skipping unchanged snapshots."""
         for key in self.state_keys_as_evidence:
             if key in channel_values:
                 evidence_id = f"state:{key}:{accumulator.last_step}"
-                if evidence_id not in accumulator.seen_ids:
-                    accumulator.seen_ids.add(evidence_id)
-                    accumulator.evidence.append(Evidence(
-                        evidence_id=evidence_id,
-                        source=f"state:{key}",
-                        retrieved_at=datetime.now(timezone.utc),
-                        snapshot=self._safe_serialize(channel_values[key]),
-                    ))
-
-    def _process_writes(self, writes: dict, accumulator: _ThreadAccumulator):
+                if evidence_id in accumulator.step_seen:
+                    continue
+                accumulator.step_seen.add(evidence_id)
+                snapshot = self._safe_serialize(channel_values[key])
+                # Compare encoded bytes: dict state is recorded by reference, so
+                # a node mutating it in place would otherwise equal itself
+                encoded = _json.dumps(snapshot, default=str)
+                if accumulator.last_state.get(key) == encoded:
+                    continue
+                accumulator.last_state[key] = encoded
+                accumulator.evidence.append(Evidence(
+                    evidence_id=evidence_id,
+                    source=f"state:{key}",
+                    retrieved_at=now,
+                    snapshot=snapshot,
+                ))
+
+    def _process_writes(self, writes: dict, accumulator: _ThreadAccumulator, now: datetime):
         """Process node writes for action detection."""
         for node_name, write_data in writes.items():
             if node_name in self.action_node_names or self._looks_like_action(node_name, write_data):
                 action_id = f"node:{node_name}:{accumulator.last_step}"
-                if action_id not in accumulator.seen_ids:
-                    accumulator.seen_ids.add(action_id)
+                if action_id not in accumulator.step_seen:
+                    accumulator.step_seen.add(action_id)
                     accumulator.actions.append(Action(
                         action_id=action_id,
                         tool=node_name,
-                        committed_at=datetime.now(timezone.utc),
+                        committed_at=now,
                         params=self._safe_serialize(write_data),
                         success=True,
                     ))
 
-    def _extract_tool_calls(self, messages: list, accumulator: _ThreadAccumulator):
+    def _extract_tool_calls(self, messages: list, accumulator: _ThreadAccumulator, now: datetime):
         """Extract tool calls from LangGraph message format."""
-        for msg in messages:
-            tool_calls = self._get_tool_calls(msg)
+        # Every checkpoint replays the whole message history, so this loop
+        # mostly skips seen ids; keep its lookups in locals
+        seen_ids = accumulator.seen_ids
+        is_write_tool = self.cfg.is_write_tool
+        get_tool_calls = self._get_tool_calls
+        add_action = accumulator.actions.append
+        add_evidence = accumulator.evidence.append
 
-            for tc in tool_calls:
-                tc_id = tc.get("id") or str(uuid.uuid4())
-                if tc_id in accumulator.seen_ids:
+        for msg in messages:
+            for tc in get_tool_calls(msg):
+                tc_id = tc.get("id") or uuid.uuid4().hex
+                if tc_id in seen_ids:
                     continue
-                accumulator.seen_ids.add(tc_id)
+                seen_ids.add(tc_id)
 
                 tool_name = tc.get("name") or tc.get("function", {}).get("name", "unknown")
                 tool_args = tc.get("args") or tc.get("function", {}).get("arguments", {})
@@ -234,23 +278,23 @@ class ContextGraphCheckpointer:
                 # Parse JSON args if string
                 if isinstance(tool_args, str):
                     try:
-                        tool_args = json.loads(tool_args)
+                        tool_args = _json.loads(tool_args)
                     except (json.JSONDecodeError, TypeError):
                         tool_args = {"raw": tool_args}
 
-                if self.cfg.is_write_tool(tool_name):
-                    accumulator.actions.append(Action(
+                if is_write_tool(tool_name):
+                    add_action(Action(
                         action_id=tc_id,
                         tool=tool_name,
-                        committed_at=datetime.now(timezone.utc),
+                        committed_at=now,
                         params=tool_args,
                         success=True,
                     ))
                 else:
-                    accumulator.evidence.append(Evidence(
+                    add_evidence(Evidence(
                         evidence_id=tc_id,
                         source=tool_name,
-                        retrieved_at=datetime.now(timezone.utc),
+                        retrieved_at=now,
                         tool_name=tool_name,
                         tool_args=tool_args,
                     ))
@@ -270,15 +314,16 @@ class ContextGraphCheckpointer:
 
     def _looks_like_action(self, node_name: str, write_data: Any) -> bool:
         """Heuristic to detect action nodes."""
-        action_patterns = ["write", "send", "create", "update", "delete", "post", "put", "execute"]
-        return any(p in node_name.lower() for p in action_patterns)
+        return _is_action_node_name(node_name)
 
     def _safe_serialize(self, obj: Any) -> dict:
         """Safely serialize an object to a dict."""
         if isinstance(obj, dict):
             return obj
+        if isinstance(obj, _JSON_SCALARS):
+            return {"value": obj}
         try:
-            return {"value": json.loads(json.dumps(obj, default=str))}
+            return {"value": _json.loads(_json.dumps(obj, default=str))}
         except Exception:
             return {"value": str(obj)}
 
@@ -300,7 +345,7 @@ class ContextGraphCheckpointer:
             retrieved_at=datetime.now(timezone.utc),
             snapshot=self._safe_serialize(interrupt_value),
         ))
-        logger.debug(f"Interrupt recorded for thread {accumulator.thread_id}")
+        logger.debug("Interrupt recorded for thread %s", accumulator.thread_id)
 
     def on_resume(self, config: dict, approver_id: str, resume_value: Any = None):
         """Call this when resuming from an interrupt (human approved).
@@ -319,7 +364,7 @@ class ContextGraphCheckpointer:
                 reason=str(resume_value) if resume_value else None,
             ))
             accumulator.pending_interrupt = False
-            logger.debug(f"Resume approved by {approver_id} for thread {accumulator.thread_id}")
+            logger.debug("Resume approved by %s for thread %s", approver_id, accumulator.thread_id)
 
     # ==========================================================================
     # Finalization
@@ -337,19 +382,27 @@ class ContextGraphCheckpointer:
         Returns:
             The created DecisionRecord, or None if no actions were recorded
         """
+        record = self._build_final_record(config, success)
+        if record is not None:
+            self.client.ingest_decision(record)
+            logger.info("Created DecisionRecord %s for thread %s", record.decision_id, record.run_id)
+        return record
+
+    def _build_final_record(self, config: dict, success: bool) -> Optional[DecisionRecord]:
+        """Pop the thread's accumulator and build its DecisionRecord."""
         thread_id = self._get_thread_id(config)
         accumulator = self._threads.pop(thread_id, None)
 
         if not accumulator:
-            logger.debug(f"No accumulator found for thread {thread_id}")
+            logger.debug("No accumulator found for thread %s", thread_id)
             return None
 
         # Only create record if there were actions
         if not accumulator.actions:
-            logger.debug(f"No actions for thread {thread_id}, skipping DecisionRecord")
+            logger.debug("No actions for thread %s, skipping DecisionRecord", thread_id)
             return None
 
-        record = DecisionRecord(
+        return DecisionRecord(
             run_id=thread_id,
             timestamp=accumulator.start_time,
             outcome=Outcome.COMMITTED if success else Outcome.DENIED,
@@ -360,10 +413,6 @@ class ContextGraphCheckpointer:
             metadata={"steps": accumulator.last_step},
         )
 
-        self.client.ingest_decision(record)
-        logger.info(f"Created DecisionRecord {record.decision_id} for thread {thread_id}")
-        return record
-
 
 def _safe_get(obj: Any, attr: str, default: Any = None) -> Any:
     """Safely get an attribute from an object, supporting both dict and object access."""
@@ -408,27 +457,17 @@ class AsyncContextGraphCheckpointer(ContextGraphCheckpointer):
         new_versions: dict[str, int],
     ) -> dict:
         """Async store checkpoint and extract decision data."""
-        try:
-            accumulator = self._get_accumulator(config)
-            step = _safe_get(metadata, "step", 0)
-            accumulator.last_step = step
-
-            channel_values = checkpoint.get("channel_values", {})
-            self._extract_state_evidence(channel_values, accumulator)
-
-            writes = _safe_get(metadata, "writes", {})
-            if writes:
-                self._process_writes(writes, accumulator)
-
-            messages = channel_values.get("messages", [])
-            if messages:
-                self._extract_tool_calls(messages, accumulator)
-
-        except Exception as e:
-            logger.warning(f"Error processing checkpoint: {e}")
-
+        self._record_checkpoint(config, checkpoint, metadata)
         return await self.underlying.aput(config, checkpoint, metadata, new_versions)
 
+    async def afinalize_thread(self, config: dict, success: bool = True) -> Optional[DecisionRecord]:
+        """Async finalize; delivery does not block the event loop."""
+        record = self._build_final_record(config, success)
+        if record is not None:
+            await self.client.aingest_decision(record)
+            logger.info("Created DecisionRecord %s for thread %s", record.decision_id, record.run_id)
+        return record
+
     async def aput_writes(
         self,
         config: dict,
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from contextgraph.core import _json
 from contextgraph.core.client import ContextGraphClient
 from contextgraph.core.models import (
     DecisionRecord, Evidence, Action, PolicyEval, Outcome, PolicyResult,
@@ -63,7 +64,11 @@ class ContextGraphTraceProcessor:
 
         Args:
             client: Optional pre-configured ContextGraphClient
-            config: Optional Config object
+            config: Optional Config object. Pass
+                ``Config(async_ingest=True, batch_endpoint=True)`` to deliver
+                records from a background worker, batched through
+                /v1/decisions/batch, so on_trace_end never waits on the
+                network; call shutdown() to stop that worker.
             write_tools: List of tool names that are write operations (actions)
             read_tools: List of tool names that are read operations (evidence)
             server_url: URL of the ContextGraph server (default: http://localhost:8080)
@@ -85,6 +90,12 @@ class ContextGraphTraceProcessor:
 
         self.client = client or ContextGraphClient(self.config)
         self._active_traces: dict[str, _TraceAccumulator] = {}
+        self._span_handlers = {
+            "function": self._handle_tool_span,
+            "tool": self._handle_tool_span,
+            "guardrail": self._handle_guardrail_span,
+            "handoff": self._handle_handoff_span,
+        }
 
     def on_trace_start(self, trace: "Trace") -> None:
         """Called when a new trace begins."""
@@ -98,7 +109,7 @@ class ContextGraphTraceProcessor:
                 metadata=_safe_get(trace, "metadata", {}),
             )
         except Exception as e:
-            logger.warning(f"Error in on_trace_start: {e}")
+            logger.warning("Error in on_trace_start: %s", e)
 
     def on_trace_end(self, trace: "Trace") -> None:
         """Called when a trace completes. Creates DecisionRecord if actions were taken."""
@@ -110,7 +121,7 @@ class ContextGraphTraceProcessor:
 
             # Only create DecisionRecord if there were actions (writes)
             if not accumulator.actions:
-                logger.debug(f"Trace {trace_id} had no actions, skipping DecisionRecord")
+                logger.debug("Trace %s had no actions, skipping DecisionRecord", trace_id)
                 return
 
             record = DecisionRecord(
@@ -127,10 +138,10 @@ class ContextGraphTraceProcessor:
             )
 
             self.client.ingest_decision(record)
-            logger.info(f"Created DecisionRecord {record.decision_id} for trace {trace_id}")
+            logger.info("Created DecisionRecord %s for trace %s", record.decision_id, trace_id)
 
         except Exception as e:
-            logger.error(f"Error in on_trace_end: {e}", exc_info=True)
+            logger.error("Error in on_trace_end: %s", e, exc_info=True)
 
     def on_span_start(self, span: "Span") -> None:
         """Called when a span begins."""
@@ -149,17 +160,12 @@ class ContextGraphTraceProcessor:
 
             span_type = _safe_get(span, "span_type")
             # Handle both enum and string types
-            span_type_str = span_type.value if hasattr(span_type, 'value') else str(span_type)
-
-            if span_type_str in ("function", "tool"):
-                self._handle_tool_span(span, accumulator)
-            elif span_type_str == "guardrail":
-                self._handle_guardrail_span(span, accumulator)
-            elif span_type_str == "handoff":
-                self._handle_handoff_span(span, accumulator)
+            handler = self._span_handlers.get(getattr(span_type, "value", span_type))
+            if handler is not None:
+                handler(span, accumulator)
 
         except Exception as e:
-            logger.warning(f"Error in on_span_end: {e}")
+            logger.warning("Error in on_span_end: %s", e)
 
     def _handle_tool_span(self, span: "Span", accumulator: "_TraceAccumulator"):
         """Process a tool/function call span."""
@@ -171,14 +177,15 @@ class ContextGraphTraceProcessor:
         # Parse JSON args if string
         if isinstance(tool_args, str):
             try:
-                tool_args = json.loads(tool_args)
+                tool_args = _json.loads(tool_args)
             except (json.JSONDecodeError, TypeError):
                 tool_args = {"raw": tool_args}
 
-        # Parse JSON output if string
-        if isinstance(tool_output, str):
+        # Parse JSON output if string; most outputs are plain text, so only
+        # attempt it when the output could be a JSON document
+        if isinstance(tool_output, str) and tool_output.lstrip()[:1] in ("{", "["):
             try:
-                tool_output = json.loads(tool_output)
+                tool_output = _json.loads(tool_output)
             except (json.JSONDecodeError, TypeError):
                 pass  # Keep as string
 
@@ -247,16 +254,22 @@ class ContextGraphTraceProcessor:
         self.client.flush()
 
 
+_MISSING = object()
+
+
 def _safe_get(obj: Any, attr: str, default: Any = None) -> Any:
-    """Safely get an attribute from an object, supporting both dict and object access."""
-    if obj is None:
-        return default
-    if isinstance(obj, dict):
-        return obj.get(attr, default)
-    return getattr(obj, attr, default)
+    """Safely get an attribute from an object, supporting both dict and object access.
+
+    SDK spans and traces are objects, so attribute access is tried first and
+    the dict lookup only runs when it misses.
+    """
+    value = getattr(obj, attr, _MISSING)
+    if value is _MISSING:
+        return obj.get(attr, default) if isinstance(obj, dict) else default
+    return value
 
 
-@dataclass
+@dataclass(slots=True)
 class _TraceAccumulator:
     """Internal state for accumulating span data into a DecisionRecord."""
     trace_id: str
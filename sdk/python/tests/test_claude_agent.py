@@ -1,8 +1,9 @@
 """Tests for the Claude Agent SDK integration."""
 
+import threading
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -23,6 +24,7 @@ def mock_client():
     """Create a mock ContextGraphClient."""
     client = MagicMock()
     client.ingest_decision = MagicMock(return_value=True)
+    client.aingest_decision = AsyncMock(side_effect=lambda d: client.ingest_decision(d))
     return client
 
 
@@ -80,6 +82,32 @@ class TestContextGraphHooksFactory:
         pre_hook = hooks["pre_tool_use"]
         assert "test_policy" in pre_hook.policies
 
+    def test_default_client_starts_no_worker_thread(self):
+        """Per-run hooks must not leave an ingest thread behind."""
+        before = threading.active_count()
+        for _ in range(20):
+            hooks = contextgraph_hooks()
+        assert threading.active_count() == before
+        assert not hooks["stop"].client.config.async_ingest
+
+    @pytest.mark.asyncio
+    async def test_default_stop_hook_delivers_off_the_event_loop(self):
+        """The Stop hook sends from a worker thread, not the loop thread."""
+        hooks = contextgraph_hooks(write_tools=["Write"])
+        client = hooks["stop"].client
+        threads = []
+        await hooks["post_tool_use"]("Write", {"file_path": "/tmp/out"}, "ok")
+        with patch.object(client, "_send_to_server", side_effect=lambda d: threads.append(threading.current_thread())):
+            await hooks["stop"](stop_reason="COMPLETED")
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+
+    def test_explicit_config_is_respected(self, config):
+        """An explicit config keeps its own ingest mode."""
+        hooks = contextgraph_hooks(config=config)
+        assert not hooks["stop"].client.config.async_ingest
+
 
 class TestContextGraphHooksClass:
     """Tests for the ContextGraphHooks class."""
@@ -185,6 +213,23 @@ class TestPreToolUseHook:
         assert len(accumulator.policies) == 1
         assert accumulator.policies[0].result == PolicyResult.WARN
 
+    @pytest.mark.asyncio
+    async def test_awaits_async_policies(self, config, accumulator):
+        """Hook awaits coroutine policies instead of treating them as truthy."""
+        async def async_policy(name, input, ctx):
+            return {"passed": False, "message": "Remote check failed"}
+
+        hook = ContextGraphPreToolUseHook(
+            accumulator, config,
+            policies={"remote": async_policy}
+        )
+
+        result = await hook("Bash", {"command": "deploy"})
+
+        assert result["allow"] is False
+        assert accumulator.policies[0].result == PolicyResult.FAIL
+        assert accumulator.policies[0].message == "Remote check failed"
+
     @pytest.mark.asyncio
     async def test_runs_all_policies(self, config, accumulator):
         """Hook runs all configured policies."""
@@ -302,6 +347,24 @@ class TestPostToolUseHook:
 
         assert accumulator.evidence[0].snapshot == {"output": "plain text output"}
 
+    @pytest.mark.asyncio
+    async def test_decodes_bytes_output(self, config, accumulator):
+        """Hook decodes bytes output (e.g. raw shell output) as text."""
+        hook = ContextGraphPostToolUseHook(accumulator, config)
+
+        await hook("Bash", {"command": "ls"}, b"file.txt\n\xff")
+
+        assert accumulator.actions[0].result == {"output": "file.txt\n\ufffd"}
+
+    @pytest.mark.asyncio
+    async def test_bytes_json_output_is_parsed(self, config, accumulator):
+        """Hook parses JSON delivered as bytes."""
+        hook = ContextGraphPostToolUseHook(accumulator, config)
+
+        await hook("Read", {}, b'  {"key": "value"}')
+
+        assert accumulator.evidence[0].snapshot == {"key": "value"}
+
 
 class TestStopHook:
     """Tests for the Stop hook."""
@@ -1,8 +1,9 @@
 """Tests for the LangGraph integration."""
 
+import threading
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -21,6 +22,7 @@ def mock_client():
     """Create a mock ContextGraphClient."""
     client = MagicMock()
     client.ingest_decision = MagicMock(return_value=True)
+    client.aingest_decision = AsyncMock(side_effect=lambda d: client.ingest_decision(d))
     return client
 
 
@@ -174,6 +176,80 @@ class TestContextGraphCheckpointer:
         accumulator = checkpointer._threads["test-thread-123"]
         assert len(accumulator.actions) == 1  # Not 2
 
+    def test_step_scoped_ids_are_dropped_when_step_advances(self, checkpointer, mock_underlying, thread_config):
+        """State and node ids are only remembered for the current step."""
+        checkpoint = {
+            "channel_values": {
+                "customer_data": {"name": "Acme"},
+                "messages": [{"tool_calls": [{"id": "tc1", "name": "send_email", "args": {}}]}],
+            }
+        }
+
+        for step in range(1, 6):
+            metadata = {"step": step, "writes": {"send_node": {"n": step}}}
+            checkpointer.put(thread_config, checkpoint, metadata, {})
+            checkpointer.put(thread_config, checkpoint, metadata, {})
+
+        accumulator = checkpointer._threads["test-thread-123"]
+        assert accumulator.step_seen == {"state:customer_data:5", "node:send_node:5"}
+        assert accumulator.seen_ids == {"tc1"}
+        assert len(accumulator.evidence) == 1  # state never changed
+        assert len(accumulator.actions) == 5 + 1  # one node action per step, tool call once
+
+    def test_state_evidence_only_recorded_when_changed(self, checkpointer, mock_underlying, thread_config):
+        """Unchanged state across steps is recorded once; changes are recorded."""
+        for step, tier in enumerate(["free", "free", "enterprise", "enterprise"], start=1):
+            checkpoint = {"channel_values": {"customer_data": {"name": "Acme", "tier": tier}}}
+            checkpointer.put(thread_config, checkpoint, {"step": step, "writes": {}}, {})
+
+        accumulator = checkpointer._threads["test-thread-123"]
+        assert [e.evidence_id for e in accumulator.evidence] == [
+            "state:customer_data:1", "state:customer_data:3",
+        ]
+        assert accumulator.evidence[1].snapshot == {"name": "Acme", "tier": "enterprise"}
+
+    def test_concurrent_first_calls_share_accumulator(self, checkpointer, thread_config):
+        """Racing first calls for a thread all get the same accumulator."""
+        barrier = threading.Barrier(8)
+        results = []
+
+        def get():
+            barrier.wait()
+            results.append(checkpointer._get_accumulator(thread_config))
+
+        workers = [threading.Thread(target=get) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert all(acc is checkpointer._threads["test-thread-123"] for acc in results)
+
+    def test_state_mutated_in_place_is_recorded(self, checkpointer, thread_config):
+        """A node mutating a state dict in place still produces new evidence."""
+        state = {"tier": "gold"}
+        checkpoint = {"channel_values": {"customer_data": state}}
+        checkpointer.put(thread_config, checkpoint, {"step": 1, "writes": {}}, {})
+        state["tier"] = "silver"
+        checkpointer.put(thread_config, checkpoint, {"step": 2, "writes": {}}, {})
+
+        accumulator = checkpointer._threads["test-thread-123"]
+        assert [e.evidence_id for e in accumulator.evidence] == [
+            "state:customer_data:1", "state:customer_data:2",
+        ]
+
+
+class TestDefaultClient:
+    """Tests for the client built when none is passed."""
+
+    def test_default_client_starts_no_worker_thread(self, mock_underlying):
+        """A checkpointer per graph run must not leave an ingest thread behind."""
+        before = threading.active_count()
+        for _ in range(20):
+            checkpointer = ContextGraphCheckpointer(underlying=mock_underlying)
+        assert threading.active_count() == before
+        assert not checkpointer.client.config.async_ingest
+
 
 class TestHITLSupport:
     """Tests for human-in-the-loop support."""
@@ -392,6 +468,18 @@ class TestAsyncCheckpointer:
         accumulator = async_checkpointer._threads["test-thread-123"]
         assert len(accumulator.actions) == 1
 
+    @pytest.mark.asyncio
+    async def test_afinalize_thread_uses_async_ingest(self, async_checkpointer, mock_client, thread_config):
+        """afinalize_thread delivers through aingest_decision."""
+        accumulator = async_checkpointer._get_accumulator(thread_config)
+        accumulator.actions.append(MagicMock())
+
+        record = await async_checkpointer.afinalize_thread(thread_config)
+
+        assert record is not None
+        mock_client.aingest_decision.assert_awaited_once_with(record)
+        assert "test-thread-123" not in async_checkpointer._threads
+
 
 class TestIntegration:
     """Integration tests for realistic workflows."""
@@ -1,6 +1,7 @@
 """Tests for OpenAI Agents SDK integration."""
 
 import json
+import threading
 import pytest
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
@@ -8,7 +9,7 @@ from typing import Any, Optional
 from enum import Enum
 from unittest.mock import Mock, patch, MagicMock
 
-from contextgraph.integrations.openai_agents import ContextGraphTraceProcessor
+from contextgraph.integrations.openai_agents import ContextGraphTraceProcessor, _safe_get
 from contextgraph.core.config import Config
 from contextgraph.core.client import ContextGraphClient
 
@@ -62,6 +63,30 @@ class TestContextGraphTraceProcessor:
         assert processor.config is not None
         assert processor.client is not None
 
+    def test_default_processor_starts_no_worker_thread(self):
+        """Test default processors do not leave an ingest thread behind."""
+        before = threading.active_count()
+        for _ in range(20):
+            processor = ContextGraphTraceProcessor()
+        assert threading.active_count() == before
+        assert not processor.config.async_ingest
+
+    def test_async_batching_is_opt_in(self):
+        """Test a background batching config is used when passed explicitly."""
+        processor = ContextGraphTraceProcessor(config=Config(async_ingest=True, batch_endpoint=True))
+        try:
+            assert processor.client._worker_thread is not None
+        finally:
+            processor.shutdown()
+        assert processor.client._worker_thread is None
+
+    def test_explicit_config_is_respected(self):
+        """Test a caller-provided config is used as-is."""
+        config = Config()
+        processor = ContextGraphTraceProcessor(config=config)
+        assert processor.config is config
+        assert not processor.config.async_ingest
+
     def test_init_with_write_tools(self):
         """Test processor respects write_tools config."""
         processor = ContextGraphTraceProcessor(
@@ -208,6 +233,46 @@ class TestContextGraphTraceProcessor:
         assert len(record.evidence) == 1
         assert record.evidence[0].source == "get_account"
 
+    def test_tool_output_parsed_only_when_json_document(self):
+        """Test JSON documents are parsed and plain-text output is kept."""
+        processor = ContextGraphTraceProcessor(write_tools=["send_email"])
+        processor.client = Mock()
+        processor.on_trace_start(MockTrace(
+            trace_id="trace_123", name="test-agent", group_id=None,
+            metadata={}, start_time=datetime.now(timezone.utc),
+        ))
+
+        for span_id, output in (("s1", ' {"name": "Acme"}'), ("s2", "no results")):
+            processor.on_span_end(MockSpan(
+                span_id=span_id, trace_id="trace_123", parent_span_id=None,
+                span_type=MockSpanType.FUNCTION, name="get_account",
+                start_time=datetime.now(timezone.utc), end_time=datetime.now(timezone.utc),
+                attributes={"function.name": "get_account", "function.output": output},
+            ))
+
+        evidence = processor._active_traces["trace_123"].evidence
+        assert evidence[0].snapshot == {"output": {"name": "Acme"}}
+        assert evidence[1].snapshot == {"output": "no results"}
+
+    def test_plain_string_span_type_is_dispatched(self):
+        """Test span types given as plain strings reach their handler."""
+        processor = ContextGraphTraceProcessor(write_tools=["send_email"])
+        processor.client = Mock()
+        processor.on_trace_start(MockTrace(
+            trace_id="trace_123", name="test-agent", group_id=None,
+            metadata={}, start_time=datetime.now(timezone.utc),
+        ))
+
+        for span_type in ("tool", "agent"):
+            processor.on_span_end(MockSpan(
+                span_id=span_type, trace_id="trace_123", parent_span_id=None,
+                span_type=span_type, name="send_email",
+                start_time=datetime.now(timezone.utc), end_time=datetime.now(timezone.utc),
+                attributes={"function.name": "send_email"},
+            ))
+
+        assert len(processor._active_traces["trace_123"].actions) == 1
+
     def test_guardrail_span_creates_policy(self):
         """Test guardrail span creates policy evaluation."""
         processor = ContextGraphTraceProcessor(write_tools=["action"])
@@ -423,6 +488,21 @@ class TestConfigWriteToolDetection:
         config = Config(read_tools=["get_data"])
         assert not config.is_write_tool("get_data")
 
+    def test_reassigned_tool_lists_are_used(self):
+        """Test replacing write_tools/read_tools after construction takes effect."""
+        config = Config(write_tools=["old_tool"])
+        config.write_tools = ["lookup_and_file"]
+        config.read_tools = ["send_digest"]
+        assert not config.is_write_tool("old_tool")
+        assert config.is_write_tool("lookup_and_file")
+        assert not config.is_write_tool("send_digest")
+
+    def test_tool_lists_mutated_in_place_are_used(self):
+        """Test appending to write_tools after construction takes effect."""
+        config = Config()
+        config.write_tools.append("Deploy")
+        assert config.is_write_tool("Deploy")
+
     def test_heuristic_detection(self):
         """Test heuristic-based write tool detection."""
         config = Config()
@@ -439,3 +519,22 @@ class TestConfigWriteToolDetection:
         assert not config.is_write_tool("fetch_data")
         assert not config.is_write_tool("search_records")
         assert not config.is_write_tool("list_items")
+
+
+class TestSafeGet:
+    """Test the span/trace field accessor."""
+
+    def test_object_attributes(self):
+        """Test attribute access on SDK objects, including falsy values."""
+        span = MockSpan(span_id="s", trace_id="t", parent_span_id=None,
+                        span_type=MockSpanType.TOOL, name="", start_time=None,
+                        end_time=None, attributes={})
+        assert _safe_get(span, "trace_id") == "t"
+        assert _safe_get(span, "parent_span_id", "default") is None
+        assert _safe_get(span, "missing", "default") == "default"
+
+    def test_dicts_and_none(self):
+        """Test dict lookup and None fall back to the default."""
+        assert _safe_get({"trace_id": "t"}, "trace_id") == "t"
+        assert _safe_get({}, "trace_id", "default") == "default"
+        assert _safe_get(None, "trace_id", "default") == "default"
@@ -6,6 +6,7 @@ import os
 import secrets
 import time
 import uuid
+import zlib
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -17,7 +18,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import psycopg2
 from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 
 # =============================================================================
@@ -31,6 +32,7 @@ RATE_LIMIT_REQUESTS = int(os.environ.get("RATE_LIMIT_REQUESTS", "100"))
 RATE_LIMIT_WINDOW = int(os.environ.get("RATE_LIMIT_WINDOW", "60"))  # seconds
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 REQUIRE_AUTH = os.environ.get("REQUIRE_AUTH", "true").lower() == "true"
+MAX_DECOMPRESSED_BYTES = int(os.environ.get("MAX_DECOMPRESSED_BYTES", str(16 * 1024 * 1024)))
 
 
 # =============================================================================
@@ -182,6 +184,86 @@ app.add_middleware(
 )
 
 
+# =============================================================================
+# Gzip Request Middleware
+# =============================================================================
+
+class GzipRequestMiddleware:
+    """Decompress request bodies sent with Content-Encoding: gzip."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            name == b"content-encoding" and value.strip().lower() == b"gzip"
+            for name, value in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        received = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            # A compressed body larger than the decompressed cap is never valid
+            if received > MAX_DECOMPRESSED_BYTES:
+                await self._error(scope, receive, send, 413, "Request body too large")
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(b"".join(chunks), MAX_DECOMPRESSED_BYTES)
+            too_large = bool(decompressor.unconsumed_tail)
+        except zlib.error:
+            await self._error(scope, receive, send, 400, "Invalid gzip request body")
+            return
+        if too_large:
+            await self._error(scope, receive, send, 413, "Decompressed request body too large")
+            return
+        if not decompressor.eof:
+            await self._error(scope, receive, send, 400, "Truncated gzip request body")
+            return
+
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        delivered = False
+
+        async def receive_decompressed():
+            nonlocal delivered
+            if not delivered:
+                delivered = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app({**scope, "headers": headers}, receive_decompressed, send)
+
+    @staticmethod
+    async def _error(scope, receive, send, status: int, detail: str):
+        response = JSONResponse(
+            status_code=status,
+            content={
+                "type": f"https://contextgraph.dev/errors/{status}",
+                "title": "Error",
+                "status": status,
+                "detail": detail,
+                "instance": scope["path"],
+            },
+        )
+        await response(scope, receive, send)
+
+
+app.add_middleware(GzipRequestMiddleware)
+
+
 # =============================================================================
 # Request ID Middleware
 # =============================================================================
@@ -463,6 +545,51 @@ def readiness():
 # API Endpoints
 # =============================================================================
 
+_INSERT_DECISION_SQL_TEMPLATE = """
+    INSERT INTO decision_records
+    (decision_id, run_id, tenant_id, trace_id, timestamp, actor_type, actor_id,
+     outcome, outcome_reason, subject_entities, evidence, policies, approvals, actions, metadata)
+    VALUES {values}
+    ON CONFLICT (decision_id) DO UPDATE SET
+        outcome = EXCLUDED.outcome,
+        outcome_reason = EXCLUDED.outcome_reason,
+        evidence = EXCLUDED.evidence,
+        policies = EXCLUDED.policies,
+        approvals = EXCLUDED.approvals,
+        actions = EXCLUDED.actions,
+        updated_at = NOW()
+"""
+
+_INSERT_DECISION_SQL = _INSERT_DECISION_SQL_TEMPLATE.format(
+    values="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
+# Multi-row form for execute_values, which expands the single %s
+_INSERT_DECISIONS_SQL = _INSERT_DECISION_SQL_TEMPLATE.format(values="%s")
+
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "1000"))
+
+
+def _decision_row(decision: DecisionRecordCreate) -> tuple:
+    """Build the INSERT parameters for a decision record."""
+    return (
+        decision.decision_id,
+        decision.run_id,
+        "default",
+        decision.trace_id,
+        decision.timestamp,
+        decision.actor.type if decision.actor else None,
+        decision.actor.id if decision.actor else None,
+        decision.outcome,
+        decision.outcome_reason,
+        json.dumps([e.model_dump() for e in decision.subject_entities]),
+        json.dumps([e.model_dump() for e in decision.evidence]),
+        json.dumps([p.model_dump() for p in decision.policies]),
+        json.dumps([a.model_dump() for a in decision.approvals]),
+        json.dumps([a.model_dump() for a in decision.actions]),
+        json.dumps(decision.metadata),
+    )
+
+
 @app.post(
     "/v1/decisions",
     tags=["Decisions"],
@@ -474,40 +601,7 @@ def create_decision(decision: DecisionRecordCreate, request: Request):
     try:
         conn = get_db_connection()
         cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO decision_records
-            (decision_id, run_id, tenant_id, trace_id, timestamp, actor_type, actor_id,
-             outcome, outcome_reason, subject_entities, evidence, policies, approvals, actions, metadata)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (decision_id) DO UPDATE SET
-                outcome = EXCLUDED.outcome,
-                outcome_reason = EXCLUDED.outcome_reason,
-                evidence = EXCLUDED.evidence,
-                policies = EXCLUDED.policies,
-                approvals = EXCLUDED.approvals,
-                actions = EXCLUDED.actions,
-                updated_at = NOW()
-            RETURNING decision_id
-            """,
-            (
-                decision.decision_id,
-                decision.run_id,
-                "default",
-                decision.trace_id,
-                decision.timestamp,
-                decision.actor.type if decision.actor else None,
-                decision.actor.id if decision.actor else None,
-                decision.outcome,
-                decision.outcome_reason,
-                json.dumps([e.model_dump() for e in decision.subject_entities]),
-                json.dumps([e.model_dump() for e in decision.evidence]),
-                json.dumps([p.model_dump() for p in decision.policies]),
-                json.dumps([a.model_dump() for a in decision.approvals]),
-                json.dumps([a.model_dump() for a in decision.actions]),
-                json.dumps(decision.metadata),
-            )
-        )
+        cur.execute(_INSERT_DECISION_SQL + "RETURNING decision_id", _decision_row(decision))
         conn.commit()
         logger.info(
             f"Decision created: {decision.decision_id}",
@@ -527,6 +621,47 @@ def create_decision(decision: DecisionRecordCreate, request: Request):
             release_db_connection(conn)
 
 
+@app.post(
+    "/v1/decisions/batch",
+    tags=["Decisions"],
+    dependencies=[Depends(verify_api_key), Depends(check_rate_limit)],
+)
+def create_decisions_batch(decisions: list[DecisionRecordCreate], request: Request):
+    """Ingest several decision records in one transaction."""
+    if len(decisions) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(decisions)} exceeds maximum of {MAX_BATCH_SIZE} decisions",
+        )
+    conn = None
+    try:
+        conn = get_db_connection()
+        cur = conn.cursor()
+        # One statement cannot upsert the same row twice, so keep the last copy
+        latest = {d.decision_id: d for d in decisions}
+        execute_values(
+            cur, _INSERT_DECISIONS_SQL, [_decision_row(d) for d in latest.values()],
+            page_size=MAX_BATCH_SIZE,
+        )
+        conn.commit()
+        logger.info(
+            f"Decision batch created: {len(decisions)} records",
+            extra={
+                "request_id": getattr(request.state, "request_id", None),
+                "extra_data": {"count": len(decisions)},
+            }
+        )
+        return {"decision_ids": [d.decision_id for d in decisions], "status": "created"}
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"Failed to create decision batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to create decision records")
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+
 @app.get(
     "/v1/decisions/{decision_id}",
     tags=["Decisions"],
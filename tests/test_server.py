@@ -1,5 +1,6 @@
 """Tests for the ContextGraph Server API."""
 
+import gzip
 import json
 import os
 import uuid
@@ -139,6 +140,90 @@ class TestDecisionEndpoints:
         response = client.post("/v1/decisions", json={})
         assert response.status_code == 422  # Validation error
 
+    def test_create_decision_batch_success(self, client, mock_db_pool, sample_decision):
+        """POST /v1/decisions/batch inserts all records in one transaction."""
+        mock_cursor, mock_conn = mock_db_pool
+        second = {**sample_decision, "decision_id": str(uuid.uuid4())}
+
+        with patch("server.main.execute_values") as execute_values:
+            response = client.post("/v1/decisions/batch", json=[sample_decision, second])
+        assert response.status_code == 200
+        data = response.json()
+        assert data["decision_ids"] == [sample_decision["decision_id"], second["decision_id"]]
+        assert len(execute_values.call_args[0][2]) == 2
+        mock_conn.commit.assert_called_once()
+
+    def test_create_decision_batch_collapses_duplicates(self, client, mock_db_pool, sample_decision):
+        """POST /v1/decisions/batch upserts a repeated decision_id once, last copy wins."""
+        updated = {**sample_decision, "outcome": "denied"}
+
+        with patch("server.main.execute_values") as execute_values:
+            response = client.post("/v1/decisions/batch", json=[sample_decision, updated])
+        assert response.status_code == 200
+        rows = execute_values.call_args[0][2]
+        assert len(rows) == 1
+        assert rows[0][7] == "denied"
+
+    def test_create_decision_batch_rejects_oversized(self, client, mock_db_pool, sample_decision):
+        """POST /v1/decisions/batch rejects batches above MAX_BATCH_SIZE."""
+        with patch("server.main.MAX_BATCH_SIZE", 1):
+            response = client.post("/v1/decisions/batch", json=[sample_decision, sample_decision])
+        assert response.status_code == 413
+
+    def test_create_decision_accepts_gzip_body(self, client, mock_db_pool, sample_decision):
+        """POST /v1/decisions accepts Content-Encoding: gzip bodies."""
+        body = gzip.compress(json.dumps(sample_decision).encode())
+        response = client.post(
+            "/v1/decisions",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 200
+        assert response.json()["decision_id"] == sample_decision["decision_id"]
+
+    def test_invalid_gzip_body_returns_400(self, client, mock_db_pool):
+        """Malformed gzip bodies are rejected before validation."""
+        response = client.post(
+            "/v1/decisions",
+            content=b"not gzip",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    def test_oversized_gzip_body_returns_413(self, client, mock_db_pool):
+        """Decompressed bodies above MAX_DECOMPRESSED_BYTES are rejected."""
+        body = gzip.compress(b" " * 2048)
+        with patch("server.main.MAX_DECOMPRESSED_BYTES", 1024):
+            response = client.post(
+                "/v1/decisions",
+                content=body,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            )
+        assert response.status_code == 413
+
+    def test_oversized_compressed_body_returns_413(self, client, mock_db_pool):
+        """Compressed bodies above MAX_DECOMPRESSED_BYTES are rejected unread."""
+        # Random bytes do not compress, so the gzip body exceeds the cap itself
+        body = gzip.compress(os.urandom(2048))
+        with patch("server.main.MAX_DECOMPRESSED_BYTES", 1024):
+            response = client.post(
+                "/v1/decisions",
+                content=body,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            )
+        assert response.status_code == 413
+        assert response.json()["detail"] == "Request body too large"
+
+    def test_truncated_gzip_body_returns_400(self, client, mock_db_pool, sample_decision):
+        """Gzip bodies cut off before the end of the stream are rejected."""
+        body = gzip.compress(json.dumps(sample_decision).encode())[:-8]
+        response = client.post(
+            "/v1/decisions",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
     def test_get_decision_success(self, client, mock_db_pool):
         """GET /v1/decisions/{id} returns a decision."""
         decision_id = str(uuid.uuid4())